@@ -2,35 +2,156 @@
 """
 Create application icon
 """
-from PySide6.QtGui import QIcon, QPixmap, QPainter, QColor, QFont
-from PySide6.QtCore import QSize
+import functools
+import struct
+from pathlib import Path
 
-def create_icon():
-    """Create a simple application icon"""
-    pixmap = QPixmap(64, 64)
-    pixmap.fill(QColor(30, 144, 255))  # Dodger blue background
+# Qt and NumPy are imported inside the functions that need them so importing
+# this module stays cheap for callers that only want the asset paths.
+_BG = (30, 144, 255)  # Dodger blue background
+_FG = (255, 255, 255)
+_FONT = ("Arial", 32)
+# Qt maps PNG quality to zlib level as (100 - quality) * 9 / 91, so 89 -> level 1
+_PNG_QUALITY = 89
+ICO_SIZES = (16, 32, 48, 64, 256)
+# Generated once at install/build time; the app loads icon.png from here
+ASSET_DIR = Path(__file__).resolve().parent
+PNG_PATH = ASSET_DIR / "icon.png"
+ICO_PATH = ASSET_DIR / "icon.ico"
+
+@functools.lru_cache(maxsize=None)
+def _glyph_path(family, point_size, char):
+    """Return the laid-out outline of ``char`` with its baseline at the origin."""
+    from PySide6.QtGui import QFont, QPainterPath
 
-    painter = QPainter(pixmap)
-    painter.setPen(QColor(255, 255, 255))
-    painter.setFont(QFont("Arial", 32, QFont.Weight.Bold))
+    font = QFont(family, point_size, QFont.Weight.Bold)
+    path = QPainterPath()
+    path.addText(0, 0, font, char)
+    return path
 
-    # Draw music note symbol
-    painter.drawText(16, 48, "♪")
+@functools.lru_cache(maxsize=None)
+def _glyph_mask(size=64):
+    """Rasterize the note once into a ``size`` x ``size`` coverage mask (0-255)."""
+    import numpy as np
+    from PySide6.QtCore import Qt
+    from PySide6.QtGui import QColor, QImage, QPainter
 
+    mask = QImage(size, size, QImage.Format.Format_Alpha8)
+    # Clear and draw in one painter session
+    painter = QPainter(mask)
+    painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
+    painter.fillRect(mask.rect(), Qt.GlobalColor.transparent)
+    painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceOver)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.scale(size / 64, size / 64)
+    painter.translate(16, 48)
+    painter.fillPath(_glyph_path(*_FONT, "♪"), QColor(*_FG))
     painter.end()
+    rows = np.frombuffer(mask.constBits(), dtype=np.uint8).reshape(size, mask.bytesPerLine())
+    return rows[:, :size].astype(np.uint32)
+
+def _compose(mask):
+    """Blend the foreground over the background through ``mask`` without QPainter."""
+    import numpy as np
+    from PySide6.QtGui import QImage
+
+    coverage = mask
+    remainder = 255 - coverage
+    red, green, blue = (
+        (bg * remainder + fg * coverage + 127) // 255
+        for bg, fg in zip(_BG, _FG)
+    )
+    pixels = np.ascontiguousarray(0xFF000000 | (red << 16) | (green << 8) | blue, dtype=np.uint32)
+    height, width = pixels.shape
+    # copy() detaches the image from the temporary numpy buffer
+    return QImage(pixels.tobytes(), width, height, width * 4, QImage.Format.Format_ARGB32_Premultiplied).copy()
+
+def _create_image(size=64):
+    """Render the icon artwork as a QImage; callers that only save files use this."""
+    return _compose(_glyph_mask(size))
+
+@functools.lru_cache(maxsize=1)
+def create_icon():
+    """Create a simple application icon.
+
+    The icon is rendered once and cached; a QGuiApplication must exist
+    before the first call so fonts can be resolved.
+    """
+    from PySide6.QtGui import QIcon, QPixmap
 
-    icon = QIcon(pixmap)
-    return icon
+    return QIcon(QPixmap.fromImage(_create_image()))
+
+def create_icon_multi(sizes=ICO_SIZES):
+    """Return ``{size: QImage}``, rendering only the largest size and downscaling the rest."""
+    from PySide6.QtCore import Qt
+
+    largest = max(sizes)
+    source = _create_image(largest)
+    return {
+        size: source if size == largest else source.scaled(
+            size, size, Qt.AspectRatioMode.IgnoreAspectRatio, Qt.TransformationMode.SmoothTransformation
+        )
+        for size in sizes
+    }
+
+def _encode_png(image):
+    """Encode ``image`` as PNG bytes in memory."""
+    from PySide6.QtCore import QBuffer, QIODevice
+
+    buffer = QBuffer()
+    buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+    if not image.save(buffer, "PNG", _PNG_QUALITY):
+        return b""
+    return bytes(buffer.data())
+
+def _png_to_ico(frames):
+    """Pack ``{size: png_bytes}`` frames into one ICO container (Vista+ PNG icons)."""
+    header = struct.pack("<HHH", 0, 1, len(frames))
+    entries = b""
+    offset = 6 + 16 * len(frames)
+    for size, png_bytes in sorted(frames.items()):
+        dimension = size if size < 256 else 0
+        entries += struct.pack("<BBBBHHII", dimension, dimension, 0, 0, 1, 32, len(png_bytes), offset)
+        offset += len(png_bytes)
+    return header + entries + b"".join(png for _, png in sorted(frames.items()))
+
+def assets_up_to_date():
+    """Return True when both icon files exist and are newer than this script."""
+    source_mtime = Path(__file__).stat().st_mtime
+    try:
+        return all(path.stat().st_mtime >= source_mtime for path in (PNG_PATH, ICO_PATH))
+    except OSError:
+        return False
 
 if __name__ == "__main__":
-    from PySide6.QtWidgets import QApplication
+    import argparse
     import sys
 
-    app = QApplication(sys.argv)
-    icon = create_icon()
-    pixmap = icon.pixmap(QSize(64, 64))
-    png_ok = pixmap.save("icon.png")
-    ico_ok = pixmap.save("icon.ico")
+    parser = argparse.ArgumentParser(description="Generate icon.png and icon.ico")
+    parser.add_argument("--force", action="store_true", help="Regenerate icons even if they are up to date")
+    args = parser.parse_args()
+    if not args.force and assets_up_to_date():
+        print("Icons are up to date: icon.png, icon.ico")
+        sys.exit(0)
+
+    from PySide6.QtGui import QGuiApplication
+
+    app = QGuiApplication(sys.argv)
+    frames = {size: _encode_png(image) for size, image in create_icon_multi().items()}
+    png_bytes = frames.get(64, b"")
+    png_ok = ico_ok = False
+    if png_bytes:
+        try:
+            PNG_PATH.write_bytes(png_bytes)
+            png_ok = True
+        except OSError:
+            pass
+    if all(frames.values()):
+        try:
+            ICO_PATH.write_bytes(_png_to_ico(frames))
+            ico_ok = True
+        except OSError:
+            pass
     if png_ok:
         print("Icon created: icon.png")
     if ico_ok:
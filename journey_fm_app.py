@@ -8,20 +8,33 @@ Features system tray integration, log viewing, and easy setup.
 
 import sys
 import os
+import csv
+import functools
+import json
+import re
 import logging
+import logging.handlers
+import sqlite3
+import threading
+import time
+import urllib.parse
 import webbrowser
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
 
-from journeyfm.config_store import load_runtime_config, save_runtime_config
-from journeyfm.plex_service import PlexConnectionError, fetch_playlists, validate_playlist_target
+from journeyfm import json_codec
+from journeyfm.config_store import load_runtime_config, resolve_runtime_config, save_runtime_config
+from journeyfm.history_service import ANALYTICS_ARTISTS_SQL, ANALYTICS_RUNS_SQL, HISTORY_ENTRIES_SQL, init_history_db
+from journeyfm.paths import write_text_atomic
+from journeyfm.plex_service import PlexConnectionError, connect_to_plex_server, fetch_playlists, validate_playlist_target
 from journeyfm.update_service import format_result_summary, run_update_job
 
 # GUI imports
 try:
-    from PySide6.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QWidget, QPushButton, QTextEdit, QLineEdit, QLabel, QHBoxLayout, QDialog, QListWidget, QListWidgetItem, QTableWidget, QTableWidgetItem, QHeaderView, QCheckBox, QInputDialog, QMessageBox, QProgressBar, QSystemTrayIcon, QMenu, QComboBox, QGroupBox, QFormLayout, QSpinBox, QTextBrowser, QTabWidget, QDialogButtonBox, QSplitter, QGridLayout
-    from PySide6.QtCore import QTimer, Qt, QThread, Signal, QSettings, QUrl
-    from PySide6.QtGui import QIcon, QDesktopServices, QFont, QFontDatabase, QAction
+    from PySide6.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QWidget, QPushButton, QPlainTextEdit, QLineEdit, QLabel, QHBoxLayout, QDialog, QListWidget, QListWidgetItem, QTableWidget, QTableWidgetItem, QTableView, QHeaderView, QCheckBox, QInputDialog, QMessageBox, QProgressBar, QSystemTrayIcon, QMenu, QComboBox, QGroupBox, QFormLayout, QSpinBox, QTextBrowser, QTabWidget, QDialogButtonBox, QSplitter, QGridLayout
+    from PySide6.QtCore import QAbstractTableModel, QModelIndex, QObject, QTimer, Qt, QThread, QThreadPool, QRunnable, Signal, QSettings, QUrl, QFileSystemWatcher
+    from PySide6.QtGui import QIcon, QImage, QPixmap, QDesktopServices, QFont, QFontDatabase, QAction
 except Exception as gui_import_error:
     print("Failed to start GUI: required Qt/PySide6 dependencies are missing or not loadable.")
     print(f"Details: {gui_import_error}")
@@ -35,7 +48,10 @@ def configure_logging():
     handlers = []
 
     try:
-        handlers.append(logging.FileHandler('app_log.txt', encoding='utf-8'))
+        # Buffer file writes; errors and interpreter shutdown flush the buffer
+        file_handler = logging.FileHandler('app_log.txt', encoding='utf-8')
+        file_handler.setFormatter(logging.Formatter(log_format))
+        handlers.append(logging.handlers.MemoryHandler(64, flushLevel=logging.ERROR, target=file_handler))
     except Exception:
         pass
 
@@ -51,11 +67,53 @@ def configure_logging():
 configure_logging()
 logger = logging.getLogger(__name__)
 
+# Directory holding the app's bundled assets and buy-list files
+APP_DIR = Path(__file__).resolve().parent
+
+# Only the tail of playlist_log.txt is shown; older lines stay on disk
+LOG_TAIL_BYTES = 256 * 1024
+LOG_MAX_BLOCKS = 5000
+
+# How long a discovered Plex server connection is reused before plex.tv is asked again
+PLEX_SERVER_CACHE_TTL = 300
+
+BUY_LIST_PURCHASED_PREFIX = "[Purchased] "
+
+# A buy-list entry is an "Artist - Title" line directly followed by its search URL
+_BUY_LIST_ENTRY_RE = re.compile(r'^(?!http)([^\n]*\S[^\n]*)\n(http[^\n]*)', re.M)
+
+class ConfigSaveSignals(QObject):
+    """Signals emitted by a ConfigSaveTask"""
+    error = Signal(str)
+
+
+class ConfigSaveTask(QRunnable):
+    """Persist config.json and keyring secrets off the GUI thread."""
+    def __init__(self, config, config_file, signals):
+        super().__init__()
+        self.config = config
+        self.config_file = config_file
+        self.signals = signals
+
+    def run(self):
+        try:
+            save_runtime_config(self.config, self.config_file)
+        except Exception as e:
+            logger.error("Failed to save configuration: %s", e)
+            self.signals.error.emit(str(e))
+
 class Config:
     """Configuration management"""
     def __init__(self):
         self.config_file = Path('config.json')
         self._cache = {}
+        self._loaded_mtime = None
+        # Single worker so queued saves land on disk in order
+        self._write_pool = QThreadPool()
+        self._write_pool.setMaxThreadCount(1)
+        # Shared by every save task; lives on the GUI thread so failures are delivered there
+        self.save_signals = ConfigSaveSignals()
+        self.save_signals.error.connect(self._save_failed)
 
     def get(self, key, default=None):
         return self._cache.get(key, default)
@@ -63,18 +121,168 @@ class Config:
     def set(self, key, value):
         self._cache[key] = value
 
+    def _file_mtime(self):
+        try:
+            return self.config_file.stat().st_mtime_ns
+        except OSError:
+            return None
+
     def load_config(self):
         """Load config using shared runtime config rules."""
         self._cache = load_runtime_config(self.config_file)
+        self._loaded_mtime = self._file_mtime()
+        return dict(self._cache)
+
+    def current_config(self):
+        """Return the cached config, reloading only when config.json changed on disk."""
+        if not self._cache or self._file_mtime() != self._loaded_mtime:
+            return self.load_config()
         return dict(self._cache)
 
     def save_config(self, config):
-        """Save config with secrets stored outside config.json when possible."""
-        save_runtime_config(config, self.config_file)
+        """Save config with secrets stored outside config.json when possible.
+
+        The in-memory values update immediately; the file/keyring write runs
+        on a background thread so the GUI never waits on fsync.
+        """
+        values = dict(self._cache)
+        # An empty token keeps the stored secret, matching save_runtime_config
+        values.update({key: value for key, value in config.items() if key != 'PLEX_TOKEN' or value})
+        self._cache = resolve_runtime_config(values)
+        self._write_pool.start(ConfigSaveTask(dict(config), self.config_file, self.save_signals))
+
+    def _save_failed(self, _message):
+        # Drop the unsaved values so the cache matches what is actually on disk
         self.load_config()
 
+    def wait_for_writes(self):
+        """Block until queued config writes have finished."""
+        self._write_pool.waitForDone()
+
+_matplotlib_modules = {}
+
+def _get_matplotlib():
+    """Import the matplotlib pieces used by the analytics dialog on first use only."""
+    if not _matplotlib_modules:
+        import numpy
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+        _matplotlib_modules.update(Figure=Figure, FigureCanvas=FigureCanvasAgg, np=numpy)
+    return _matplotlib_modules
+
+ANALYTICS_TABS = ("Growth", "Top Artists", "Update Frequency", "Match Quality", "Stations")
+ANALYTICS_DPI = 72  # Agg raster cost scales with dpi squared
+
+def _style_axis(fig, ax):
+    fig.patch.set_facecolor('#fffdf8')
+    ax.set_facecolor('#fffdf8')
+    for spine in ax.spines.values():
+        spine.set_color('#b9c2b6')
+    ax.tick_params(axis='x', colors='#22343d')
+    ax.tick_params(axis='y', colors='#22343d')
+    ax.title.set_color('#22343d')
+    ax.xaxis.label.set_color('#22343d')
+    ax.yaxis.label.set_color('#22343d')
+    ax.grid(color='#d8ddd5', linestyle='-', linewidth=0.6, alpha=0.6)
+
+def render_analytics_charts(data):
+    """Rasterize the analytics charts with the Agg backend.
+
+    Safe to call off the GUI thread; returns (tab name, width, height, RGBA bytes)
+    for each entry of ANALYTICS_TABS.
+    """
+    mpl = _get_matplotlib()
+    Figure = mpl['Figure']
+    FigureCanvas = mpl['FigureCanvas']
+    np = mpl['np']
+    dates = data['dates']
+    charts = []
+
+    def counts_array(values):
+        # Hand matplotlib ready-made arrays so it skips per-element coercion
+        return np.fromiter(values, dtype=np.int32, count=len(values))
+
+    def new_axis():
+        fig = Figure(figsize=(8, 6), dpi=ANALYTICS_DPI, tight_layout=True)
+        return fig, fig.add_subplot(111)
+
+    def rasterize(tab_name, fig, ax):
+        _style_axis(fig, ax)
+        canvas = FigureCanvas(fig)
+        canvas.draw()
+        width, height = canvas.get_width_height()
+        charts.append((tab_name, width, height, bytes(canvas.buffer_rgba())))
+
+    # Tab 1: Playlist Growth
+    fig1, ax1 = new_axis()
+    ax1.plot(dates, counts_array(data['cumulative_list']), marker='o')
+    ax1.set_title('Playlist Growth Over Time')
+    ax1.set_xlabel('Date')
+    ax1.set_ylabel('Total Songs')
+    ax1.tick_params(axis='x', rotation=45)
+    rasterize("Growth", fig1, ax1)
+
+    # Tab 2: Top Artists
+    fig2, ax2 = new_axis()
+    top_artists = data['top_artists']
+    if top_artists:
+        artists = [artist for artist, _ in top_artists]
+        ax2.bar(artists, counts_array([count for _, count in top_artists]))
+        ax2.set_title('Top 10 Artists')
+        ax2.set_xlabel('Artist')
+        ax2.set_ylabel('Songs Added')
+        ax2.tick_params(axis='x', rotation=45)
+    rasterize("Top Artists", fig2, ax2)
+
+    # Tab 3: Update Frequency
+    fig3, ax3 = new_axis()
+    ax3.bar(dates, counts_array(data['update_freq']))
+    ax3.set_title('Songs Added per Update')
+    ax3.set_xlabel('Date')
+    ax3.set_ylabel('Songs Added')
+    ax3.tick_params(axis='x', rotation=45)
+    rasterize("Update Frequency", fig3, ax3)
+
+    # Tab 4: Match efficiency
+    fig4, ax4 = new_axis()
+    ax4.plot(dates, counts_array(data['matched_counts']), marker='o', label='Matched')
+    ax4.plot(dates, counts_array(data['duplicate_counts']), marker='s', label='Duplicates Suppressed')
+    ax4.set_title('Plex Match Quality')
+    ax4.set_xlabel('Date')
+    ax4.set_ylabel('Songs')
+    ax4.tick_params(axis='x', rotation=45)
+    ax4.legend()
+    rasterize("Match Quality", fig4, ax4)
+
+    # Tab 5: Station contribution
+    fig5, ax5 = new_axis()
+    station_totals = data['station_totals']
+    if station_totals:
+        station_names = [name for name, _ in station_totals]
+        ax5.bar(station_names, counts_array([value for _, value in station_totals]))
+        ax5.set_title('Songs Scraped by Station')
+        ax5.set_xlabel('Station')
+        ax5.set_ylabel('Songs')
+    rasterize("Stations", fig5, ax5)
+
+    return charts
+
+@functools.lru_cache(maxsize=1)
+def app_icon():
+    """Return the shared application icon, loaded once (needs a QApplication)."""
+    icon_path = APP_DIR / 'icon.png'
+    return QIcon(str(icon_path)) if icon_path.exists() else QIcon()
+
 def parse_bool(value):
     """Safely parse truthy values from QSettings/JSON."""
+    try:
+        return _parse_bool_cached(value)
+    except TypeError:
+        # Unhashable values (lists, dicts) are never truthy config flags
+        return False
+
+@functools.lru_cache(maxsize=32)
+def _parse_bool_cached(value):
     if isinstance(value, bool):
         return value
     if isinstance(value, str):
@@ -388,6 +596,9 @@ class SetupWizard(QDialog):
 
 class LogViewer(QWidget):
     """Widget for viewing application logs"""
+    # Emitted before the log file is truncated so buffered writers can flush first
+    aboutToClear = Signal()
+
     def __init__(self, parent=None):
         super().__init__(parent)
         layout = QVBoxLayout()
@@ -402,8 +613,10 @@ class LogViewer(QWidget):
         layout.addLayout(header)
 
         # Log text area
-        self.log_text = QTextEdit()
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
+        # Oldest lines are evicted once the widget holds this many
+        self.log_text.setMaximumBlockCount(LOG_MAX_BLOCKS)
         log_font = QFontDatabase.systemFont(QFontDatabase.SystemFont.FixedFont)
         log_size = log_font.pointSize()
         if log_size <= 0:
@@ -411,38 +624,106 @@ class LogViewer(QWidget):
         self.log_text.setFont(log_font)
         layout.addWidget(self.log_text)
 
+        # Byte offset of the end of the text already shown
+        self._log_offset = 0
+        # (mtime, size) of the log file at the last refresh
+        self._log_stat = None
+
+        # Picks up writes from outside this window, e.g. main.py runs
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.fileChanged.connect(self.refresh_if_visible)
+        self.watch_log_file()
+
         # Load existing logs
         self.load_logs()
 
         self.setLayout(layout)
 
     def load_logs(self):
-        """Load logs from file"""
+        """Load the most recent LOG_TAIL_BYTES of the log file"""
         log_file = Path('playlist_log.txt')
         if log_file.exists():
             try:
-                with open(log_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    self.log_text.setPlainText(content)
-                    # Scroll to bottom
-                    cursor = self.log_text.textCursor()
-                    cursor.movePosition(cursor.MoveOperation.End)
-                    self.log_text.setTextCursor(cursor)
+                with open(log_file, 'rb', buffering=LOG_TAIL_BYTES) as f:
+                    f.seek(0, os.SEEK_END)
+                    size = f.tell()
+                    f.seek(max(0, size - LOG_TAIL_BYTES))
+                    content = f.read().decode('utf-8', errors='replace')
+                    self._log_offset = f.tell()
+                if size > LOG_TAIL_BYTES:
+                    # Drop the partial first line of the window
+                    content = "…(truncated)…\n" + content.split('\n', 1)[-1]
+                self.log_text.setPlainText(content)
+                # Scroll to bottom
+                cursor = self.log_text.textCursor()
+                cursor.movePosition(cursor.MoveOperation.End)
+                self.log_text.setTextCursor(cursor)
             except Exception as e:
                 self.log_text.setPlainText(f"Error loading logs: {e}")
 
     def clear_logs(self):
         """Clear the log file"""
+        # Otherwise text still buffered elsewhere would land after the truncation
+        # and be read back from offset 0 as if it were new
+        self.aboutToClear.emit()
         try:
             with open('playlist_log.txt', 'w', encoding='utf-8') as f:
                 f.write("")
             self.log_text.clear()
+            self._log_offset = 0
+            self._log_stat = None
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Failed to clear logs: {e}")
 
+    def watch_log_file(self):
+        """Start watching playlist_log.txt if it exists and is not watched yet.
+
+        The watcher drops paths that are deleted or replaced, so this is re-run
+        whenever the file may have been (re)created.
+        """
+        if 'playlist_log.txt' not in self.watcher.files() and os.path.exists('playlist_log.txt'):
+            self.watcher.addPath('playlist_log.txt')
+
+    def refresh_if_visible(self, *_args):
+        """Read new log bytes from disk unless hidden; showEvent catches up later."""
+        if self.isVisible():
+            self.refresh_logs()
+
     def refresh_logs(self):
-        """Refresh the log display"""
-        self.load_logs()
+        """Append only the bytes written since the last load/refresh"""
+        log_file = Path('playlist_log.txt')
+        self.watch_log_file()
+        try:
+            try:
+                st = log_file.stat()
+            except FileNotFoundError:
+                st = None
+            log_stat = (st.st_mtime_ns, st.st_size) if st else None
+            if log_stat is not None and log_stat == self._log_stat:
+                return  # Nothing written since the last refresh
+            self._log_stat = log_stat
+            if st is None or st.st_size < self._log_offset:
+                # File was removed or truncated outside the viewer
+                self._log_offset = 0
+                self.log_text.clear()
+                self.load_logs()
+                return
+            with open(log_file, 'rb') as f:
+                f.seek(self._log_offset)
+                data = f.read()
+            # Stop at the last complete line so a write still in progress (ours or
+            # another process's) is picked up whole on the next refresh
+            end = data.rfind(b'\n') + 1
+            self._log_offset += end
+            new_text = data[:end].decode('utf-8', errors='replace')
+        except Exception as e:
+            logger.error("Error refreshing logs: %s", e)
+            return
+        if new_text:
+            cursor = self.log_text.textCursor()
+            cursor.movePosition(cursor.MoveOperation.End)
+            cursor.insertText(new_text)
+            self.log_text.setTextCursor(cursor)
 
 class PlexFetchPlaylistsWorker(QThread):
     """Fetch Plex playlists in the background."""
@@ -488,23 +769,222 @@ class PlexConnectionTestWorker(QThread):
             self.error.emit(str(e))
 
 
-class UpdateWorker(QThread):
-    """Worker thread for running playlist updates"""
-    finished = Signal(str)
+class ProgressLogHandler(logging.Handler):
+    """Forward log records emitted on the creating thread to a progress callback."""
+    def __init__(self, callback):
+        super().__init__(level=logging.INFO)
+        self.callback = callback
+        self.thread_id = threading.get_ident()
+
+    def emit(self, record):
+        if record.thread != self.thread_id:
+            return
+        try:
+            self.callback(record.getMessage().strip())
+        except Exception:
+            self.handleError(record)
+
+
+def parse_buy_list(content):
+    """Parse amazon_buy_list.txt text into buy-list song dicts."""
+    songs = []
+    for artist_title, url in _BUY_LIST_ENTRY_RE.findall(content):
+        artist_title = artist_title.strip()
+        songs.append({
+            'artist_title': artist_title,
+            'amazon_url': url.strip(),
+            'key': artist_title.lower(),
+        })
+    return songs
+
+
+class BuyListSignals(QObject):
+    """Signals emitted by a BuyListLoader"""
+    ready = Signal(list)
+    error = Signal(str)
+
+
+class BuyListLoader(QRunnable):
+    """Pool task that reads and parses the buy-list file off the GUI thread"""
+    def __init__(self, path):
+        super().__init__()
+        self.path = path
+        self.signals = BuyListSignals()
+
+    def run(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.signals.ready.emit(parse_buy_list(f.read()))
+        except Exception as e:
+            self.signals.error.emit(str(e))
+
+
+class ExportSignals(QObject):
+    """Signals emitted by a PlaylistExportTask"""
+    finished = Signal(int)  # number of tracks written
+    playlistMissing = Signal(str)
+    error = Signal(str)
+
+
+class PlaylistExportTask(QRunnable):
+    """Pool task that writes a Plex playlist to CSV off the GUI thread"""
+    def __init__(self, get_server, plex_token, server_ip, playlist_name, path):
+        super().__init__()
+        self.get_server = get_server
+        self.plex_token = plex_token
+        self.server_ip = server_ip
+        self.playlist_name = playlist_name
+        self.path = path
+        self.signals = ExportSignals()
+
+    def run(self):
+        try:
+            plex = self.get_server(self.plex_token, self.server_ip)
+
+            try:
+                tracks = plex.playlist(self.playlist_name).items()
+            except Exception:
+                self.signals.playlistMissing.emit(self.playlist_name)
+                return
+
+            # Track XML already carries the artist (grandparent) and album (parent)
+            # titles, so no per-track artist()/album() round-trips are needed
+            rows = [
+                (track.title, track.grandparentTitle or '', track.parentTitle or '')
+                for track in tracks
+            ]
+
+            with open(self.path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+                writer = csv.writer(f)
+                writer.writerow(['Title', 'Artist', 'Album'])
+                writer.writerows(rows)
+
+            self.signals.finished.emit(len(rows))
+        except Exception as e:
+            self.signals.error.emit(str(e))
+
+
+class UpdateSignals(QObject):
+    """Signals emitted by an UpdateTask"""
+    finished = Signal(dict)  # run_update_job() result
     progress = Signal(str)
 
-    def __init__(self, config_data=None, parent=None):
-        super().__init__(parent)
+
+class UpdateTask(QRunnable):
+    """Pool task for running playlist updates"""
+    def __init__(self, config_data=None):
+        super().__init__()
         self.config_data = config_data
+        self.signals = UpdateSignals()
 
     def run(self):
+        # Stream journeyfm log messages from this run to the progress signal
+        handler = ProgressLogHandler(self.signals.progress.emit)
+        package_logger = logging.getLogger('journeyfm')
+        package_logger.addHandler(handler)
         try:
-            self.progress.emit("Starting playlist update...")
-            result = run_update_job(config=self.config_data)
-            self.finished.emit(format_result_summary(result))
+            self.signals.progress.emit("Starting playlist update...")
+            self.signals.finished.emit(run_update_job(config=self.config_data))
 
         except Exception as e:
-            self.finished.emit(f"Error: {str(e)}")
+            self.signals.finished.emit({"status": "error", "error_message": str(e)})
+        finally:
+            package_logger.removeHandler(handler)
+
+
+class AnalyticsPlotWorker(QThread):
+    """Worker thread that renders analytics charts to RGBA buffers"""
+    finished = Signal(list)
+    error = Signal(str)
+
+    def __init__(self, chart_data, parent=None):
+        super().__init__(parent)
+        self.chart_data = chart_data
+
+    def run(self):
+        try:
+            self.finished.emit(render_analytics_charts(self.chart_data))
+        except Exception as e:
+            self.error.emit(str(e))
+
+
+class HistoryModel(QAbstractTableModel):
+    """Read-only table model over (date, type, artist, song, reason) history tuples.
+
+    Cells are served straight from the tuples, so only visible rows are ever
+    turned into Qt data.
+    """
+    HEADERS = ("Date", "Type", "Artist", "Song", "Reason")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._entries = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._entries)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        return self._entries[index.row()][index.column()]
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def append_entries(self, entries):
+        if not entries:
+            return
+        start = len(self._entries)
+        self.beginInsertRows(QModelIndex(), start, start + len(entries) - 1)
+        self._entries.extend(entries)
+        self.endInsertRows()
+
+
+class HistorySignals(QObject):
+    """Signals emitted by a HistoryLoader"""
+    rowsReady = Signal(list)
+    pageLoaded = Signal(bool)  # True when older runs remain
+    error = Signal(str)
+
+
+class HistoryLoader(QRunnable):
+    """Pool task that reads one page of playlist history runs and emits its entries in batches"""
+    BATCH_SIZE = 500
+    PAGE_RUNS = 200
+
+    def __init__(self, offset=0, db_path='playlist_history.db'):
+        super().__init__()
+        self.offset = offset
+        self.db_path = db_path
+        self.signals = HistorySignals()
+        self._cancelled = False
+
+    def cancel(self):
+        """Stop emitting rows after the current batch"""
+        self._cancelled = True
+
+    def run(self):
+        try:
+            # sqlite3 connections are bound to the thread that opened them
+            conn = sqlite3.connect(self.db_path)
+            try:
+                cursor = conn.execute(HISTORY_ENTRIES_SQL, (self.PAGE_RUNS, self.offset))
+                while not self._cancelled:
+                    batch = cursor.fetchmany(self.BATCH_SIZE)
+                    if not batch:
+                        break
+                    self.signals.rowsReady.emit(batch)
+                total_runs = conn.execute('SELECT COUNT(*) FROM history').fetchone()[0]
+                self.signals.pageLoaded.emit(total_runs > self.offset + self.PAGE_RUNS)
+            finally:
+                conn.close()
+        except Exception as e:
+            self.signals.error.emit(str(e))
 
 
 class PreviewWorker(QThread):
@@ -532,17 +1012,39 @@ class PreviewWorker(QThread):
 
 class MainWindow(QMainWindow):
     """Main application window"""
+    logAppended = Signal()  # lines from append_log() have been flushed to disk
+
     def __init__(self):
         super().__init__()
         self.tray_icon = None  # Will be set later
+        self._history_conn = None
+        self._analytics_cache = {}
+        self._server_cache = (None, None, 0.0)
+        self._log_fh = None
+        # Buffered playlist_log.txt writes are pushed to disk at most once a second
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setInterval(1000)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.timeout.connect(self.flush_log)
         self.config = Config()
         self.config.load_config()
+        self.config.save_signals.error.connect(self.config_save_failed)
         self.connection_verified = False
+        # Updates write the playlist and history, so they run one at a time on a
+        # persistent pool thread
+        self.update_pool = QThreadPool(self)
+        self.update_pool.setMaxThreadCount(1)
+        self._update_task = None
+        self._update_in_flight = False
+        self._export_task = None
+        self._export_in_flight = False
+        self._preview_in_flight = False
+        self._buy_list_loading = False
+        self._last_update_monotonic = None
 
         self.setWindowTitle("Journey FM Playlist Creator")
-        icon_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'icon.png')
-        if os.path.exists(icon_path):
-            self.setWindowIcon(QIcon(icon_path))
+        if not app_icon().isNull():
+            self.setWindowIcon(app_icon())
         self.resize(980, 700)
         self.setMinimumSize(860, 600)
 
@@ -590,17 +1092,12 @@ class MainWindow(QMainWindow):
         toolbar = self.addToolBar("Main")
         toolbar.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextBesideIcon)
 
-        update_action = QAction("Update Now", self)
-        update_action.triggered.connect(self.manual_update)
-        toolbar.addAction(update_action)
-
-        settings_action = QAction("Settings", self)
-        settings_action.triggered.connect(self.show_settings)
-        toolbar.addAction(settings_action)
-
-        test_action = QAction("Test Plex", self)
-        test_action.triggered.connect(self.refresh_connection_status)
-        toolbar.addAction(test_action)
+        for text, slot in (
+            ("Update Now", self.manual_update),
+            ("Settings", self.show_settings),
+            ("Test Plex", self.refresh_connection_status),
+        ):
+            toolbar.addAction(text).triggered.connect(slot)
         toolbar.setObjectName("MainToolbar")
 
         # Progress bar
@@ -626,45 +1123,24 @@ class MainWindow(QMainWindow):
         # Buttons in grid layout
         button_layout = QGridLayout()
         
-        # Row 1
-        self.update_button = QPushButton("Update Playlist")
-        self.update_button.clicked.connect(self.run_update_playlist)
-        button_layout.addWidget(self.update_button, 0, 0)
-
-        self.preview_button = QPushButton("Preview Sync")
-        self.preview_button.clicked.connect(self.preview_update)
-        button_layout.addWidget(self.preview_button, 0, 1)
-        
-        self.buy_list_button = QPushButton("Show Buy List")
-        self.buy_list_button.clicked.connect(self.show_buy_list)
-        button_layout.addWidget(self.buy_list_button, 0, 2)
-        
-        # Row 2
-        self.history_button = QPushButton("View History")
-        self.history_button.clicked.connect(self.show_history)
-        button_layout.addWidget(self.history_button, 1, 0)
-        
-        self.export_button = QPushButton("Export Playlist")
-        self.export_button.clicked.connect(self.export_playlist)
-        button_layout.addWidget(self.export_button, 1, 1)
-
-        self.station_health_button = QPushButton("Station Health")
-        self.station_health_button.clicked.connect(self.show_station_health)
-        button_layout.addWidget(self.station_health_button, 1, 2)
-        
-        # Row 3
-        self.stats_button = QPushButton("Statistics")
-        self.stats_button.clicked.connect(self.show_statistics)
-        button_layout.addWidget(self.stats_button, 2, 0)
-        
-        self.analytics_button = QPushButton("Analytics")
-        self.analytics_button.clicked.connect(self.show_analytics)
-        button_layout.addWidget(self.analytics_button, 2, 1)
+        # Three buttons per row, in this order
+        buttons = (
+            ('update_button', "Update Playlist", self.run_update_playlist),
+            ('preview_button', "Preview Sync", self.preview_update),
+            ('buy_list_button', "Show Buy List", self.show_buy_list),
+            ('history_button', "View History", self.show_history),
+            ('export_button', "Export Playlist", self.export_playlist),
+            ('station_health_button', "Station Health", self.show_station_health),
+            ('stats_button', "Statistics", self.show_statistics),
+            ('analytics_button', "Analytics", self.show_analytics),
+            ('web_dashboard_button', "Open Web Dashboard", self.open_web_dashboard),
+        )
+        for index, (attr, text, slot) in enumerate(buttons):
+            button = QPushButton(text)
+            button.clicked.connect(slot)
+            button_layout.addWidget(button, *divmod(index, 3))
+            setattr(self, attr, button)
 
-        self.web_dashboard_button = QPushButton("Open Web Dashboard")
-        self.web_dashboard_button.clicked.connect(self.open_web_dashboard)
-        button_layout.addWidget(self.web_dashboard_button, 2, 2)
-        
         status_layout.addLayout(button_layout)
 
         status_group.setLayout(status_layout)
@@ -672,6 +1148,10 @@ class MainWindow(QMainWindow):
 
         # Log viewer
         self.log_viewer = LogViewer()
+        # The viewer reads appended lines back from disk, so its offset always
+        # matches the file even when main.py writes to it too
+        self.logAppended.connect(self.log_viewer.refresh_if_visible)
+        self.log_viewer.aboutToClear.connect(self.flush_log)
         splitter.addWidget(self.log_viewer)
 
         splitter.setSizes([100, 400])
@@ -680,6 +1160,10 @@ class MainWindow(QMainWindow):
         # Setup timer for automatic updates
         self.update_timer = QTimer()
         self.update_timer.timeout.connect(self.auto_update)
+        # Parsed auto-update schedule; load_settings() refreshes it from the config
+        self._auto_update = False
+        self._schedule = None
+        self.requested_interval_ms = 0
 
         self.apply_modern_theme()
 
@@ -831,7 +1315,7 @@ class MainWindow(QMainWindow):
             QCheckBox { color: #22343d; }
 
             /* ── Text areas ── */
-            QTextEdit {
+            QTextEdit, QPlainTextEdit {
                 color: #22343d;
                 background-color: #fffdf8;
                 border: 1px solid #d7d9d2;
@@ -839,7 +1323,7 @@ class MainWindow(QMainWindow):
             }
 
             /* ── Tables ── */
-            QTableWidget {
+            QTableView {
                 color: #22343d;
                 background-color: #ffffff;
                 alternate-background-color: #f6f8f4;
@@ -847,11 +1331,11 @@ class MainWindow(QMainWindow):
                 selection-color: #ffffff;
                 selection-background-color: #1f7668;
             }
-            QTableWidget::item {
+            QTableView::item {
                 color: #22343d;
                 background-color: #ffffff;
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 color: #ffffff;
                 background-color: #1f7668;
             }
@@ -907,9 +1391,84 @@ class MainWindow(QMainWindow):
     def set_action_controls_enabled(self, enabled):
         self.update_button.setEnabled(enabled)
         self.preview_button.setEnabled(enabled)
-        self.export_button.setEnabled(enabled)
+        # A running export keeps its button off until the task reports back
+        self.export_button.setEnabled(enabled and not self._export_in_flight)
         self.station_health_button.setEnabled(True)
 
+    def append_log(self, text):
+        """Append a line to playlist_log.txt through a long-lived buffered handle.
+
+        The write is flushed by a one-second timer or close_log(), not immediately;
+        flush_log() emits logAppended once the text is on disk.
+        """
+        try:
+            if self._log_fh is None:
+                self._log_fh = open('playlist_log.txt', 'a', encoding='utf-8', newline='', buffering=65536)
+            self._log_fh.write(text + '\n')
+            if not self._log_flush_timer.isActive():
+                self._log_flush_timer.start()
+        except Exception as e:
+            logger.error("Error writing to log: %s", e)
+
+    def flush_log(self):
+        if self._log_fh is not None:
+            try:
+                self._log_fh.flush()
+            except Exception as e:
+                logger.error("Error flushing log: %s", e)
+                return
+            # The first flush may have created the file the viewer watches
+            self.log_viewer.watch_log_file()
+            self.logAppended.emit()
+
+    def close_log(self):
+        if self._log_fh is not None:
+            self._log_fh.close()
+            self._log_fh = None
+
+    def history_db(self):
+        """Return the shared playlist_history.db connection, opening it on first use."""
+        if self._history_conn is None:
+            # bring older databases up to the current schema and date index once per process
+            init_history_db('playlist_history.db')
+            conn = sqlite3.connect('playlist_history.db')
+            # WAL lets these reads run alongside the update worker's writes
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute('PRAGMA mmap_size=268435456')
+            conn.execute('PRAGMA cache_size=-4096')  # 4 MiB page cache, kept warm across dialogs
+            self._history_conn = conn
+        return self._history_conn
+
+    def close_history_db(self):
+        if self._history_conn is not None:
+            self._history_conn.close()
+            self._history_conn = None
+
+    def _get_plex_server(self, plex_token, server_ip):
+        """Return a PlexServer for the given settings, reusing a recent discovery.
+
+        Also called from export tasks on the pool; the cache is replaced as a single
+        tuple so readers never see a partial entry.
+        """
+        cached_key, cached_server, cached_at = self._server_cache
+        now = time.monotonic()
+        key = (plex_token, server_ip)
+        if cached_server is not None and cached_key == key and now - cached_at < PLEX_SERVER_CACHE_TTL:
+            return cached_server
+        plex = connect_to_plex_server(plex_token, server_ip)
+        self._server_cache = (key, plex, now)
+        return plex
+
+    def config_save_failed(self, message):
+        # Config has already reloaded from disk; re-apply the schedule it holds
+        self.load_settings()
+        QMessageBox.warning(
+            self,
+            "Settings Not Saved",
+            f"Failed to save configuration: {message}\n\nThe previous settings have been restored."
+        )
+
     def set_tray_icon(self, tray_icon):
         """Set the tray icon reference"""
         self.tray_icon = tray_icon
@@ -930,9 +1489,17 @@ class MainWindow(QMainWindow):
         auto_update = parse_bool(self.config.get('AUTO_UPDATE', False))
         interval = int(self.config.get('UPDATE_INTERVAL', 15))
         unit = self.config.get('UPDATE_UNIT', 'Minutes')
+        schedule = (auto_update, interval, unit)
+        if schedule == self._schedule:
+            return
+        self._schedule = schedule
+        self._auto_update = auto_update
         self.requested_interval_ms = interval * 60 * 1000 if unit != 'Hours' else interval * 60 * 60 * 1000
         if auto_update:
-            self.update_timer.stop()
+            # A running timer picks up the new interval; otherwise the timer is
+            # started once the Plex connection is verified
+            if self.update_timer.isActive() and self.update_timer.interval() != self.requested_interval_ms:
+                self.update_timer.setInterval(self.requested_interval_ms)
             self.status_label.setText(f"Auto-update armed (every {interval} {unit.lower()})")
             self.auto_status_chip.setText(f"Auto: On ({interval} {unit.lower()})")
         else:
@@ -965,7 +1532,7 @@ class MainWindow(QMainWindow):
         self.connection_status_chip.setText('Plex: Connected')
         self.status_label.setText(payload.get('message', 'Plex connection verified'))
         self.set_action_controls_enabled(True)
-        if parse_bool(self.config.get('AUTO_UPDATE', False)):
+        if self._auto_update and not self.update_timer.isActive():
             self.update_timer.start(self.requested_interval_ms)
 
     def _on_connection_error(self, message):
@@ -980,16 +1547,16 @@ class MainWindow(QMainWindow):
         if not self.connection_verified:
             QMessageBox.warning(self, 'Plex Not Ready', 'Validate Plex connection before running updates.')
             return
-        if hasattr(self, 'worker') and self.worker.isRunning():
+        if self._update_in_flight:
             QMessageBox.information(self, "Update in Progress",
                                   "An update is already running. Please wait.")
             return
 
         self.set_action_controls_enabled(False)
-        self.worker = UpdateWorker(self.config.load_config())
-        self.worker.progress.connect(self.update_progress)
-        self.worker.finished.connect(self.update_finished)
-        self.worker.start()
+        task = UpdateTask(self.config.current_config())
+        task.signals.progress.connect(self.update_progress)
+        task.signals.finished.connect(self.update_finished)
+        self.start_update_task(task)
 
         self.progress_bar.setVisible(True)
         self.progress_bar.setRange(0, 0)  # Indeterminate progress
@@ -1009,49 +1576,54 @@ class MainWindow(QMainWindow):
         self.last_sync_chip.setText(f"Last sync: {last_sync}")
         self.status_label.setText("Ready")
 
-        # Append result to log file
-        try:
-            with open('playlist_log.txt', 'a', encoding='utf-8') as f:
-                f.write(result + '\n')
-        except Exception as e:
-            logger.error("Error writing to log: %s", e)
+        summary = format_result_summary(result)
 
-        # Refresh logs
-        self.log_viewer.refresh_logs()
+        # Append result to log file
+        self.append_log(summary)
 
         # Show result in status
-        if "Error" in result:
-            QMessageBox.warning(self, "Update Error", result)
+        if result.get('status') == 'error':
+            QMessageBox.warning(self, "Update Error", summary)
         else:
-            # Extract summary from result
-            lines = result.strip().split('\n')
-            summary_found = False
-            for line in reversed(lines):
-                if line.startswith("Added") or line.startswith("No new songs") or line.startswith("No matching"):
-                    self.status_label.setText(line)
-                    summary_found = True
-                    break
-            if not summary_found:
-                self.status_label.setText("Update completed")
+            self.status_label.setText(f"Added {result.get('added_count', 0)} to playlist")
 
     def auto_update(self):
         """Automatic update (runs in background)"""
         if not self.connection_verified:
             self.update_timer.stop()
             return
-        if hasattr(self, 'worker') and self.worker.isRunning():
+        if self._update_in_flight:
             return  # Skip if already running
+        # Missed timer fires delivered together (e.g. after resume from sleep)
+        # must not trigger back-to-back runs
+        if self._last_update_monotonic is not None:
+            min_gap = max(60, self.requested_interval_ms / 1000 - 5)
+            if time.monotonic() - self._last_update_monotonic < min_gap:
+                return
+
+        task = UpdateTask(self.config.current_config())
+        task.signals.finished.connect(self.auto_update_finished)
+        self.start_update_task(task)
+
+    def start_update_task(self, task):
+        """Queue an update on the update pool and track it until it finishes"""
+        self._update_in_flight = True
+        self._last_update_monotonic = time.monotonic()
+        # Keep the task (and its signals object) alive while it runs
+        self._update_task = task
+        task.signals.finished.connect(self._update_task_done)
+        self.update_pool.start(task)
 
-        self.worker = UpdateWorker(self.config.load_config())
-        self.worker.finished.connect(self.auto_update_finished)
-        self.worker.start()
+    def _update_task_done(self, _result):
+        self._update_in_flight = False
+        self._update_task = None
 
     def preview_update(self):
         """Generate a dry-run preview of sync changes before applying."""
         if not self.connection_verified:
             QMessageBox.warning(self, 'Plex Not Ready', 'Validate Plex connection before previewing updates.')
             return
-        if hasattr(self, 'preview_worker') and self.preview_worker.isRunning():
+        if self._preview_in_flight:
             QMessageBox.information(self, 'Preview in Progress', 'A preview is already running. Please wait.')
             return
 
@@ -1060,19 +1632,22 @@ class MainWindow(QMainWindow):
         self.progress_bar.setRange(0, 0)
         self.status_label.setText('Building preview...')
 
-        self.preview_worker = PreviewWorker(self.config.load_config(), self)
+        self._preview_in_flight = True
+        self.preview_worker = PreviewWorker(self.config.current_config(), self)
         self.preview_worker.progress.connect(self.update_progress)
         self.preview_worker.finished.connect(self.preview_finished)
         self.preview_worker.error.connect(self.preview_failed)
         self.preview_worker.start()
 
     def preview_finished(self, result):
+        self._preview_in_flight = False
         self.progress_bar.setVisible(False)
         self.set_action_controls_enabled(self.connection_verified)
         self.status_label.setText('Preview ready')
         self.show_preview_dialog(result)
 
     def preview_failed(self, message):
+        self._preview_in_flight = False
         self.progress_bar.setVisible(False)
         self.set_action_controls_enabled(self.connection_verified)
         self.status_label.setText('Preview failed')
@@ -1084,22 +1659,17 @@ class MainWindow(QMainWindow):
         self.last_update_label.setText(f"Last update: {last_sync}")
         self.last_sync_chip.setText(f"Last sync: {last_sync}")
 
-        # Append result to log file
-        try:
-            with open('playlist_log.txt', 'a', encoding='utf-8') as f:
-                f.write(result + '\n')
-        except Exception as e:
-            logger.error("Error writing to log: %s", e)
+        summary = format_result_summary(result)
 
-        # Refresh logs
-        self.log_viewer.refresh_logs()
+        # Append result to log file
+        self.append_log(summary)
 
         # Show tray notification if minimized
         if self.isMinimized() or not self.isVisible():
             if self.tray_icon:
                 message_icon = QSystemTrayIcon.MessageIcon.Information
                 message_text = "Playlist updated successfully"
-                if "Error" in result:
+                if result.get('status') == 'error':
                     message_icon = QSystemTrayIcon.MessageIcon.Warning
                     message_text = "Playlist update failed"
                 self.tray_icon.showMessage(
@@ -1121,45 +1691,20 @@ class MainWindow(QMainWindow):
 
     def show_buy_list(self):
         """Show the Amazon buy list dialog with interactive features"""
-        try:
-            buy_list_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'amazon_buy_list.txt')
-            with open(buy_list_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-        except FileNotFoundError:
-            QMessageBox.information(self, "No Buy List", "No buy list available. Run an update to generate the list.")
+        if self._buy_list_loading:
             return
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to read buy list file: {e}")
+        buy_list_path = APP_DIR / 'amazon_buy_list.txt'
+        self.buy_list_path = buy_list_path
+        if not buy_list_path.exists():
+            QMessageBox.information(self, "No Buy List", "No buy list available. Run an update to generate the list.")
             return
 
         try:
-            self.buy_list_state_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'amazon_buy_list_state.json')
+            self.buy_list_state_path = APP_DIR / 'amazon_buy_list_state.json'
             self.buy_list_state = self.load_buy_list_state()
 
-            # Parse content to get songs
-            lines = content.split('\n')
-            songs = []
-            i = 0
-            while i < len(lines):
-                if lines[i].startswith('Songs not in your library'):
-                    i += 2  # Skip header
-                    continue
-                if lines[i].strip() and not lines[i].startswith('http'):
-                    artist_title = lines[i].strip()
-                    if i + 1 < len(lines) and lines[i + 1].startswith('http'):
-                        url = lines[i + 1].strip()
-                        songs.append({
-                            'artist_title': artist_title,
-                            'amazon_url': url,
-                            'key': artist_title.lower(),
-                        })
-                        i += 3  # Skip blank line
-                    else:
-                        i += 1
-                else:
-                    i += 1
-
-            self.buy_list_all_songs = songs
+            # Songs are filled in once the background loader has parsed the file
+            self.buy_list_all_songs = []
 
             dialog = QDialog(self)
             dialog.setWindowTitle("Amazon Buy List")
@@ -1207,7 +1752,12 @@ class MainWindow(QMainWindow):
             search_layout = QHBoxLayout()
             search_layout.addWidget(QLabel("Search:"))
             self.search_input = QLineEdit()
-            self.search_input.textChanged.connect(self.filter_buy_list)
+            # Re-filter once typing pauses rather than on every keystroke
+            self._buy_list_filter_timer = QTimer(dialog)
+            self._buy_list_filter_timer.setSingleShot(True)
+            self._buy_list_filter_timer.setInterval(150)
+            self._buy_list_filter_timer.timeout.connect(self.filter_buy_list)
+            self.search_input.textChanged.connect(lambda _text: self._buy_list_filter_timer.start())
             search_layout.addWidget(self.search_input)
 
             self.hide_completed_checkbox = QCheckBox('Hide purchased')
@@ -1218,11 +1768,27 @@ class MainWindow(QMainWindow):
             # List widget
             self.buy_list_widget = QListWidget()
             self.buy_list_widget.setAlternatingRowColors(True)
-            self.buy_list_label = QLabel(f"Found {len(songs)} songs to buy:")
+            self.buy_list_label = QLabel("Loading buy list…")
             layout.addWidget(self.buy_list_label)
-            self.populate_buy_list(songs)
             layout.addWidget(self.buy_list_widget)
 
+            def buy_list_ready(songs):
+                self._buy_list_loading = False
+                self.buy_list_all_songs = songs
+                # Filtering honours anything typed into the search box while loading
+                self.populate_buy_list(songs)
+
+            def buy_list_failed(message):
+                self._buy_list_loading = False
+                self.buy_list_label.setText(f"Failed to read buy list file: {message}")
+
+            loader = BuyListLoader(buy_list_path)
+            loader.signals.ready.connect(buy_list_ready)
+            loader.signals.error.connect(buy_list_failed)
+            self._buy_list_loader = loader
+            self._buy_list_loading = True
+            QThreadPool.globalInstance().start(loader)
+
             # Buttons
             button_layout = QHBoxLayout()
 
@@ -1262,8 +1828,6 @@ class MainWindow(QMainWindow):
             QMessageBox.critical(self, "Error", f"Failed to show buy list dialog: {e}")
 
     def load_buy_list_state(self):
-        import json
-
         if not os.path.exists(self.buy_list_state_path):
             return {}
         try:
@@ -1274,8 +1838,6 @@ class MainWindow(QMainWindow):
             return {}
 
     def save_buy_list_state(self):
-        import json
-
         try:
             with open(self.buy_list_state_path, 'w', encoding='utf-8') as file_handle:
                 json.dump(self.buy_list_state, file_handle, indent=2)
@@ -1283,8 +1845,6 @@ class MainWindow(QMainWindow):
             logger.error('Failed to save buy-list state: %s', exc)
 
     def build_store_url(self, artist_title, provider):
-        import urllib.parse
-
         query = urllib.parse.quote_plus(artist_title)
         if provider == 'apple':
             return f'https://music.apple.com/us/search?term={query}'
@@ -1293,40 +1853,58 @@ class MainWindow(QMainWindow):
         return f'https://www.amazon.com/s?k={query}&i=digital-music'
 
     def populate_buy_list(self, songs):
-        """Populate the buy list widget"""
-        self.buy_list_widget.clear()
-        active_count = 0
-        for song in songs:
-            key = song.get('key', song.get('artist_title', '').lower())
-            purchased = bool(self.buy_list_state.get(key, {}).get('purchased', False))
-            if purchased:
-                display = f"[Purchased] {song['artist_title']}"
-            else:
-                display = song['artist_title']
-                active_count += 1
-            item = QListWidgetItem(display)
-            item.setData(1, song)
-            item.setCheckState(Qt.CheckState.Unchecked)
-            self.buy_list_widget.addItem(item)
-        self.buy_list_label.setText(f"Showing {len(songs)} songs ({active_count} not purchased)")
+        """Populate the buy list widget with every song; filtering only hides rows"""
+        widget = self.buy_list_widget
+        # Repaint and notify once after the whole batch instead of per item
+        widget.setUpdatesEnabled(False)
+        widget.blockSignals(True)
+        try:
+            widget.clear()
+            for song in songs:
+                item = QListWidgetItem(song['artist_title'])
+                item.setData(1, song)
+                item.setData(Qt.ItemDataRole.UserRole, song.get('key', song.get('artist_title', '').lower()))
+                item.setCheckState(Qt.CheckState.Unchecked)
+                widget.addItem(item)
+        finally:
+            widget.blockSignals(False)
+            widget.setUpdatesEnabled(True)
+        self.filter_buy_list()
 
     def filter_buy_list(self, *_):
-        """Filter the buy list based on search text and purchased state."""
+        """Show only rows matching the search text and purchased filter."""
         search_text = self.search_input.text().lower().strip()
         hide_purchased = self.hide_completed_checkbox.isChecked()
 
-        filtered = []
-        for song in self.buy_list_all_songs:
-            artist_title = song.get('artist_title', '')
-            if search_text and search_text not in artist_title.lower():
-                continue
-            key = song.get('key', artist_title.lower())
-            purchased = bool(self.buy_list_state.get(key, {}).get('purchased', False))
-            if hide_purchased and purchased:
-                continue
-            filtered.append(song)
-
-        self.populate_buy_list(filtered)
+        widget = self.buy_list_widget
+        shown = 0
+        active_count = 0
+        widget.setUpdatesEnabled(False)
+        widget.blockSignals(True)
+        try:
+            for i in range(widget.count()):
+                item = widget.item(i)
+                # UserRole holds the lowercased artist_title computed at parse time
+                key = item.data(Qt.ItemDataRole.UserRole)
+                purchased = bool(self.buy_list_state.get(key, {}).get('purchased', False))
+                text = item.text()
+                title = text[len(BUY_LIST_PURCHASED_PREFIX):] if text.startswith(BUY_LIST_PURCHASED_PREFIX) else text
+                display = BUY_LIST_PURCHASED_PREFIX + title if purchased else title
+                if display != text:
+                    item.setText(display)
+                # Filtering used to rebuild the list, which also cleared checks
+                if item.checkState() != Qt.CheckState.Unchecked:
+                    item.setCheckState(Qt.CheckState.Unchecked)
+                hidden = bool(search_text and search_text not in key) or (hide_purchased and purchased)
+                item.setHidden(hidden)
+                if not hidden:
+                    shown += 1
+                    if not purchased:
+                        active_count += 1
+        finally:
+            widget.blockSignals(False)
+            widget.setUpdatesEnabled(True)
+        self.buy_list_label.setText(f"Showing {shown} songs ({active_count} not purchased)")
 
     def open_selected_buy_items(self, provider='amazon'):
         """Open selected buy list items in browser for requested provider."""
@@ -1379,34 +1957,28 @@ class MainWindow(QMainWindow):
         # Remove from song cache
         updated_songs = [song for song in self.buy_list_all_songs if song.get('key', song.get('artist_title', '').lower()) not in to_remove]
 
-        # Rewrite file
+        # Rewrite file via a temp file + rename so a crash never leaves it half-written
+        body = ''.join(
+            f"{song.get('artist_title', '')}\n{song.get('amazon_url', '')}\n\n"
+            for song in updated_songs
+        )
         try:
-            with open('amazon_buy_list.txt', 'w', encoding='utf-8') as f:
-                f.write("Songs not in your library - Amazon search links:\n\n")
-                for song in updated_songs:
-                    artist_title = song.get('artist_title', '')
-                    url = song.get('amazon_url', '')
-                    f.write(f"{artist_title}\n{url}\n\n")
+            write_text_atomic(self.buy_list_path, "Songs not in your library - Amazon search links:\n\n" + body)
         except Exception as e:
             QMessageBox.warning(dialog, "Error", f"Failed to update buy list file: {e}")
             return
 
         self.buy_list_all_songs = updated_songs
-        for key in list(self.buy_list_state.keys()):
-            if key in to_remove:
-                del self.buy_list_state[key]
+        for key in to_remove:
+            self.buy_list_state.pop(key, None)
         self.save_buy_list_state()
 
         # Update display
-        self.filter_buy_list()
+        self.populate_buy_list(updated_songs)
         QMessageBox.information(dialog, "Removed", f"Removed {len(to_remove)} items from buy list.")
 
     def show_statistics(self):
         """Show statistics dashboard"""
-        import sqlite3
-        import json
-        from collections import Counter
-
         dialog = QDialog(self)
         dialog.setWindowTitle("Statistics Dashboard")
         dialog.setModal(True)
@@ -1415,15 +1987,13 @@ class MainWindow(QMainWindow):
         layout = QVBoxLayout()
 
         try:
-            conn = sqlite3.connect('playlist_history.db')
-            c = conn.cursor()
+            c = self.history_db().cursor()
             c.execute('SELECT COUNT(*), SUM(scraped_count), SUM(matched_count), SUM(added_count), SUM(missing_count), SUM(duplicate_count), SUM(skipped_count) FROM history')
             result = c.fetchone()
             c.execute("SELECT MAX(date), MAX(CASE WHEN status='success' THEN date END) FROM history")
             run_markers = c.fetchone()
             c.execute('SELECT station_breakdown FROM history')
             station_rows = c.fetchall()
-            conn.close()
 
             total_updates = result[0] or 0
             total_scraped = result[1] or 0
@@ -1436,7 +2006,7 @@ class MainWindow(QMainWindow):
             station_counter = Counter()
             for (station_json,) in station_rows:
                 try:
-                    for station in json.loads(station_json or '[]'):
+                    for station in json_codec.loads(station_json or '[]'):
                         if station.get('success'):
                             station_counter[station.get('display_name', station.get('station', 'Unknown'))] += station.get('scraped_count', 0)
                 except Exception:
@@ -1489,14 +2059,6 @@ class MainWindow(QMainWindow):
 
     def show_analytics(self):
         """Show analytics dashboard with charts"""
-        import sqlite3
-        import json
-        from datetime import datetime
-        from collections import Counter
-        import matplotlib.pyplot as plt
-        from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
-        from matplotlib.figure import Figure
-
         dialog = QDialog(self)
         dialog.setWindowTitle("Playlist Analytics")
         dialog.setModal(True)
@@ -1506,144 +2068,86 @@ class MainWindow(QMainWindow):
 
         tab_widget = QTabWidget()
 
-        def style_axis(fig, ax):
-            fig.patch.set_facecolor('#fffdf8')
-            ax.set_facecolor('#fffdf8')
-            for spine in ax.spines.values():
-                spine.set_color('#b9c2b6')
-            ax.tick_params(axis='x', colors='#22343d')
-            ax.tick_params(axis='y', colors='#22343d')
-            ax.title.set_color('#22343d')
-            ax.xaxis.label.set_color('#22343d')
-            ax.yaxis.label.set_color('#22343d')
-            ax.grid(color='#d8ddd5', linestyle='-', linewidth=0.6, alpha=0.6)
-
         try:
-            conn = sqlite3.connect('playlist_history.db')
-            c = conn.cursor()
-            c.execute('SELECT date, added_songs, missing_songs, matched_count, duplicate_count, station_breakdown FROM history ORDER BY date')
-            rows = c.fetchall()
-            conn.close()
-
-            # Prepare data
-            dates = []
-            cumulative_added = 0
-            cumulative_list = []
-            artist_counter = Counter()
-            update_freq = []
-            matched_counts = []
-            duplicate_counts = []
-            station_counter = Counter()
-
-            for date, added_json, missing_json, matched_count, duplicate_count, station_json in rows:
-                dt = datetime.fromisoformat(date)
-                dates.append(dt.strftime('%Y-%m-%d'))
-                
-                added_songs = json.loads(added_json) if added_json else []
-                cumulative_added += len(added_songs)
-                cumulative_list.append(cumulative_added)
-                update_freq.append(len(added_songs))
-                matched_counts.append(matched_count or 0)
-                duplicate_counts.append(duplicate_count or 0)
+            c = self.history_db().cursor()
+            # Charts only change when runs are recorded, so reuse the last render
+            # while the newest date and row count stay the same.
+            cache_key = c.execute('SELECT MAX(date), COUNT(*) FROM history').fetchone()
+            cached_pixmaps = self._analytics_cache.get(cache_key)
+
+            # Charts are rasterized on a worker thread; tabs show a placeholder until then
+            chart_labels = {}
+            for tab_name in ANALYTICS_TABS:
+                tab = QWidget()
+                tab_layout = QVBoxLayout()
+                chart_label = QLabel("Rendering chart…")
+                chart_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+                tab_layout.addWidget(chart_label)
+                tab.setLayout(tab_layout)
+                tab_widget.addTab(tab, tab_name)
+                chart_labels[tab_name] = chart_label
+
+            def show_pixmaps(pixmaps):
+                for tab_name, pixmap in pixmaps.items():
+                    chart_labels[tab_name].setPixmap(pixmap)
+
+            def show_charts(charts):
+                pixmaps = {}
+                for tab_name, width, height, rgba in charts:
+                    image = QImage(rgba, width, height, QImage.Format.Format_RGBA8888)
+                    pixmaps[tab_name] = QPixmap.fromImage(image)
+                self._analytics_cache = {cache_key: pixmaps}
+                show_pixmaps(pixmaps)
+
+            def show_chart_error(message):
+                for chart_label in chart_labels.values():
+                    chart_label.setText(f"Error rendering chart: {message}")
+
+            if cached_pixmaps is not None:
+                show_pixmaps(cached_pixmaps)
+            else:
+                # Prepare data
+                dates = []
+                cumulative_list = []
+                update_freq = []
+                matched_counts = []
+                duplicate_counts = []
+                station_counter = Counter()
+
+                # Per-run and running totals of added songs are computed by SQLite
+                c.execute(ANALYTICS_RUNS_SQL)
+                for date_str, added_count, cumulative_added, matched_count, duplicate_count, station_json in c:
+                    dates.append(date_str)
+                    update_freq.append(added_count)
+                    cumulative_list.append(cumulative_added)
+                    matched_counts.append(matched_count or 0)
+                    duplicate_counts.append(duplicate_count or 0)
+
+                    try:
+                        for station in json_codec.loads(station_json or '[]'):
+                            if station.get('success'):
+                                station_counter[station.get('display_name', station.get('station', 'Unknown'))] += station.get('scraped_count', 0)
+                    except Exception:
+                        pass
+
+                # Artist tallies from "Title by Artist" entries, also aggregated in SQL
+                c.execute(ANALYTICS_ARTISTS_SQL)
+                artist_counter = Counter(dict(c.fetchall()))
+
+                chart_data = {
+                    'dates': dates,
+                    'cumulative_list': cumulative_list,
+                    'top_artists': artist_counter.most_common(10),
+                    'update_freq': update_freq,
+                    'matched_counts': matched_counts,
+                    'duplicate_counts': duplicate_counts,
+                    'station_totals': list(station_counter.items()),
+                }
 
-                try:
-                    for station in json.loads(station_json or '[]'):
-                        if station.get('success'):
-                            station_counter[station.get('display_name', station.get('station', 'Unknown'))] += station.get('scraped_count', 0)
-                except Exception:
-                    pass
-                
-                for song in added_songs:
-                    # Parse artist from "Title by Artist"
-                    if " by " in song:
-                        artist = song.split(" by ", 1)[1]
-                        artist_counter[artist] += 1
-
-            # Tab 1: Playlist Growth
-            growth_tab = QWidget()
-            growth_layout = QVBoxLayout()
-            fig1 = Figure(figsize=(8, 6))
-            ax1 = fig1.add_subplot(111)
-            ax1.plot(dates, cumulative_list, marker='o')
-            ax1.set_title('Playlist Growth Over Time')
-            ax1.set_xlabel('Date')
-            ax1.set_ylabel('Total Songs')
-            ax1.tick_params(axis='x', rotation=45)
-            style_axis(fig1, ax1)
-            canvas1 = FigureCanvas(fig1)
-            growth_layout.addWidget(canvas1)
-            growth_tab.setLayout(growth_layout)
-            tab_widget.addTab(growth_tab, "Growth")
-
-            # Tab 2: Top Artists
-            artists_tab = QWidget()
-            artists_layout = QVBoxLayout()
-            fig2 = Figure(figsize=(8, 6))
-            ax2 = fig2.add_subplot(111)
-            top_artists = artist_counter.most_common(10)
-            if top_artists:
-                artists, counts = zip(*top_artists)
-                ax2.bar(artists, counts)
-                ax2.set_title('Top 10 Artists')
-                ax2.set_xlabel('Artist')
-                ax2.set_ylabel('Songs Added')
-                ax2.tick_params(axis='x', rotation=45)
-            style_axis(fig2, ax2)
-            canvas2 = FigureCanvas(fig2)
-            artists_layout.addWidget(canvas2)
-            artists_tab.setLayout(artists_layout)
-            tab_widget.addTab(artists_tab, "Top Artists")
-
-            # Tab 3: Update Frequency
-            freq_tab = QWidget()
-            freq_layout = QVBoxLayout()
-            fig3 = Figure(figsize=(8, 6))
-            ax3 = fig3.add_subplot(111)
-            ax3.bar(dates, update_freq)
-            ax3.set_title('Songs Added per Update')
-            ax3.set_xlabel('Date')
-            ax3.set_ylabel('Songs Added')
-            ax3.tick_params(axis='x', rotation=45)
-            style_axis(fig3, ax3)
-            canvas3 = FigureCanvas(fig3)
-            freq_layout.addWidget(canvas3)
-            freq_tab.setLayout(freq_layout)
-            tab_widget.addTab(freq_tab, "Update Frequency")
-
-            # Tab 4: Match efficiency
-            match_tab = QWidget()
-            match_layout = QVBoxLayout()
-            fig4 = Figure(figsize=(8, 6))
-            ax4 = fig4.add_subplot(111)
-            ax4.plot(dates, matched_counts, marker='o', label='Matched')
-            ax4.plot(dates, duplicate_counts, marker='s', label='Duplicates Suppressed')
-            ax4.set_title('Plex Match Quality')
-            ax4.set_xlabel('Date')
-            ax4.set_ylabel('Songs')
-            ax4.tick_params(axis='x', rotation=45)
-            ax4.legend()
-            style_axis(fig4, ax4)
-            canvas4 = FigureCanvas(fig4)
-            match_layout.addWidget(canvas4)
-            match_tab.setLayout(match_layout)
-            tab_widget.addTab(match_tab, "Match Quality")
-
-            # Tab 5: Station contribution
-            station_tab = QWidget()
-            station_layout = QVBoxLayout()
-            fig5 = Figure(figsize=(8, 6))
-            ax5 = fig5.add_subplot(111)
-            if station_counter:
-                station_names, station_values = zip(*station_counter.items())
-                ax5.bar(station_names, station_values)
-                ax5.set_title('Songs Scraped by Station')
-                ax5.set_xlabel('Station')
-                ax5.set_ylabel('Songs')
-            style_axis(fig5, ax5)
-            canvas5 = FigureCanvas(fig5)
-            station_layout.addWidget(canvas5)
-            station_tab.setLayout(station_layout)
-            tab_widget.addTab(station_tab, "Stations")
+                self._plot_worker = AnalyticsPlotWorker(chart_data, self)
+                self._plot_worker.finished.connect(show_charts)
+                self._plot_worker.error.connect(show_chart_error)
+                self._plot_worker.start()
 
         except Exception as e:
             error_tab = QWidget()
@@ -1681,19 +2185,23 @@ class MainWindow(QMainWindow):
             table.setHorizontalHeaderLabels(headers)
             table.setRowCount(len(rows))
             table.setAlternatingRowColors(True)
-            for row_idx, row in enumerate(rows):
-                for col_idx, value in enumerate(row):
-                    table.setItem(row_idx, col_idx, QTableWidgetItem(str(value)))
+            table.setUpdatesEnabled(False)
+            table.blockSignals(True)
+            try:
+                for row_idx, row in enumerate(rows):
+                    for col_idx, value in enumerate(row):
+                        table.setItem(row_idx, col_idx, QTableWidgetItem(str(value)))
+            finally:
+                table.blockSignals(False)
+                table.setUpdatesEnabled(True)
             table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
             return table
 
-        added_rows = []
-        for entry in result.get('added_songs', []):
-            if ' by ' in entry:
-                title, rest = entry.split(' by ', 1)
-                added_rows.append((title.strip(), rest.strip()))
-            else:
-                added_rows.append((entry, ''))
+        # Entries are "Title by Artist"; one partition pass per entry
+        added_rows = [
+            (title.strip(), rest.strip()) if sep else (title, '')
+            for title, sep, rest in (entry.partition(' by ') for entry in result.get('added_songs', []))
+        ]
         tab_widget.addTab(build_table(['Title', 'Artist/Source'], added_rows), f"Will Add ({len(added_rows)})")
 
         duplicate_rows = [
@@ -1738,10 +2246,6 @@ class MainWindow(QMainWindow):
 
     def show_station_health(self):
         """Show station reliability/quality metrics over recorded history."""
-        import sqlite3
-        import json
-        from datetime import datetime
-
         dialog = QDialog(self)
         dialog.setWindowTitle('Station Health')
         dialog.setModal(True)
@@ -1758,15 +2262,17 @@ class MainWindow(QMainWindow):
 
         station_stats = {}
         try:
-            conn = sqlite3.connect('playlist_history.db')
-            c = conn.cursor()
-            c.execute('SELECT date, station_breakdown FROM history ORDER BY date')
+            c = self.history_db().cursor()
+            # Dates are formatted by SQLite once per run, not once per station entry
+            c.execute("""
+                SELECT COALESCE(strftime('%Y-%m-%d %H:%M', date), date), station_breakdown
+                FROM history ORDER BY date
+            """)
             rows = c.fetchall()
-            conn.close()
 
-            for date_text, station_json in rows:
+            for date_str, station_json in rows:
                 try:
-                    entries = json.loads(station_json or '[]')
+                    entries = json_codec.loads(station_json or '[]')
                 except Exception:
                     entries = []
                 for entry in entries:
@@ -1788,28 +2294,31 @@ class MainWindow(QMainWindow):
                         if payload > 0:
                             data['payload_total'] += payload
                             data['payload_samples'] += 1
-                        try:
-                            data['last_success'] = datetime.fromisoformat(date_text).strftime('%Y-%m-%d %H:%M')
-                        except Exception:
-                            data['last_success'] = date_text
+                        data['last_success'] = date_str
                     else:
                         data['last_error'] = entry.get('error', '')
 
             table.setRowCount(len(station_stats))
-            for row_idx, (station_name, stats) in enumerate(sorted(station_stats.items())):
-                success_rate = (stats['success'] / stats['attempts'] * 100.0) if stats['attempts'] else 0.0
-                avg_payload = (stats['payload_total'] / stats['payload_samples'] / 1024.0) if stats['payload_samples'] else 0.0
-                values = [
-                    station_name,
-                    str(stats['attempts']),
-                    f"{success_rate:.1f}",
-                    stats['last_success'] or 'Never',
-                    stats['last_pattern'] or 'n/a',
-                    f"{avg_payload:.1f}",
-                    stats['last_error'] or '',
-                ]
-                for col_idx, value in enumerate(values):
-                    table.setItem(row_idx, col_idx, QTableWidgetItem(value))
+            table.setUpdatesEnabled(False)
+            table.blockSignals(True)
+            try:
+                for row_idx, (station_name, stats) in enumerate(sorted(station_stats.items())):
+                    success_rate = (stats['success'] / stats['attempts'] * 100.0) if stats['attempts'] else 0.0
+                    avg_payload = (stats['payload_total'] / stats['payload_samples'] / 1024.0) if stats['payload_samples'] else 0.0
+                    values = [
+                        station_name,
+                        str(stats['attempts']),
+                        f"{success_rate:.1f}",
+                        stats['last_success'] or 'Never',
+                        stats['last_pattern'] or 'n/a',
+                        f"{avg_payload:.1f}",
+                        stats['last_error'] or '',
+                    ]
+                    for col_idx, value in enumerate(values):
+                        table.setItem(row_idx, col_idx, QTableWidgetItem(value))
+            finally:
+                table.blockSignals(False)
+                table.setUpdatesEnabled(True)
         except Exception as exc:
             table.setRowCount(1)
             table.setItem(0, 0, QTableWidgetItem('Error loading station health'))
@@ -1827,10 +2336,8 @@ class MainWindow(QMainWindow):
 
     def show_history(self):
         """Show the playlist history dialog"""
-        import sqlite3
-        import json
-        from datetime import datetime
-
+        # opening the shared connection first creates the date index the loader pages over
+        self.history_db()
         dialog = QDialog(self)
         dialog.setWindowTitle("Playlist History")
         dialog.setModal(True)
@@ -1838,130 +2345,113 @@ class MainWindow(QMainWindow):
 
         layout = QVBoxLayout()
 
-        table = QTableWidget()
-        table.setColumnCount(5)
-        table.setHorizontalHeaderLabels(["Date", "Type", "Artist", "Song", "Reason"])
+        status_label = QLabel("Loading history…")
+        layout.addWidget(status_label)
+
+        table = QTableView()
+        model = HistoryModel(table)
         table.setAlternatingRowColors(True)
         table.setWordWrap(True)
-        table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
-        table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
-        table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
+        table.setModel(model)
+        # Fit the other columns once per loaded page rather than re-measuring on every batch
         table.horizontalHeader().setSectionResizeMode(3, QHeaderView.ResizeMode.Stretch)
-        table.horizontalHeader().setSectionResizeMode(4, QHeaderView.ResizeMode.ResizeToContents)
-
-        try:
-            conn = sqlite3.connect('playlist_history.db')
-            c = conn.cursor()
-            c.execute('SELECT date, added_songs, missing_songs, skipped_songs, duplicate_count FROM history ORDER BY date DESC')
-            rows = c.fetchall()
-            conn.close()
-
-            # Collect all entries
-            entries = []
-            for date, added_songs_json, missing_songs_json, skipped_songs_json, duplicate_count in rows:
-                try:
-                    dt = datetime.fromisoformat(date)
-                    date_str = dt.strftime('%Y-%m-%d %H:%M')
-                except Exception:
-                    date_str = date
-
-                # Added songs
-                try:
-                    added_songs = json.loads(added_songs_json)
-                    for song in added_songs:
-                        # Format is "Title by Artist"
-                        if " by " in song:
-                            title, artist = song.split(" by ", 1)
-                        else:
-                            title = song
-                            artist = "Unknown"
-                        entries.append((date_str, "Added", artist, title, ""))
-                except Exception:
-                    pass
-
-                # Missing songs
-                try:
-                    missing_songs = json.loads(missing_songs_json)
-                    for song in missing_songs:
-                        artist = song.get('artist', 'Unknown')
-                        title = song.get('title', 'Unknown')
-                        entries.append((date_str, "Missing", artist, title, song.get('reason', 'not-found')))
-                except Exception:
-                    pass
-
-                try:
-                    skipped_songs = json.loads(skipped_songs_json)
-                    for song in skipped_songs:
-                        artist = song.get('artist', 'Unknown')
-                        title = song.get('title', 'Unknown')
-                        entries.append((date_str, "Skipped", artist, title, song.get('reason', 'skipped')))
-                except Exception:
-                    pass
-
-                if duplicate_count:
-                    entries.append((date_str, "Info", "", "Duplicate suppression", str(duplicate_count)))
-
-            table.setRowCount(len(entries))
-            for row_idx, (date_str, type_str, artist, song, reason) in enumerate(entries):
-                table.setItem(row_idx, 0, QTableWidgetItem(date_str))
-                table.setItem(row_idx, 1, QTableWidgetItem(type_str))
-                table.setItem(row_idx, 2, QTableWidgetItem(artist))
-                table.setItem(row_idx, 3, QTableWidgetItem(song))
-                table.setItem(row_idx, 4, QTableWidgetItem(reason))
-
-        except Exception as e:
-            table.setRowCount(1)
-            table.setItem(0, 0, QTableWidgetItem("Error loading history"))
-            table.setItem(0, 1, QTableWidgetItem(str(e)))
 
         layout.addWidget(table)
 
         buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Close)
+        load_more_btn = buttons.addButton("Load more", QDialogButtonBox.ButtonRole.ActionRole)
+        load_more_btn.setEnabled(False)
         buttons.rejected.connect(dialog.close)
         layout.addWidget(buttons)
 
+        next_offset = 0
+
+        def show_error(message):
+            status_label.setText("Error loading history")
+            model.append_entries([("Error loading history", message, "", "", "")])
+
+        def page_loaded(has_more):
+            status_label.setText(f"Showing {model.rowCount()} entries")
+            table.setUpdatesEnabled(False)
+            for column in (0, 1, 2, 4):
+                table.resizeColumnToContents(column)
+            table.setUpdatesEnabled(True)
+            load_more_btn.setEnabled(has_more)
+            load_more_btn.setVisible(has_more)
+
+        def load_page():
+            # History is read on the global pool, HistoryLoader.PAGE_RUNS runs at a time
+            nonlocal next_offset
+            load_more_btn.setEnabled(False)
+            status_label.setText("Loading history…")
+            loader = HistoryLoader(next_offset)
+            next_offset += HistoryLoader.PAGE_RUNS
+            loader.signals.rowsReady.connect(model.append_entries)
+            loader.signals.pageLoaded.connect(page_loaded)
+            loader.signals.error.connect(show_error)
+            # Keep the task (and its signals object) alive while it runs
+            self._history_loader = loader
+            QThreadPool.globalInstance().start(loader)
+
+        load_more_btn.clicked.connect(load_page)
+        dialog.finished.connect(lambda _result: self._history_loader.cancel())
+        load_page()
+
         dialog.setLayout(layout)
         dialog.exec()
 
     def export_playlist(self):
         """Export the current Plex playlist to CSV"""
-        try:
-            # Get config
-            plex_token = self.config.get('PLEX_TOKEN')
-            server_ip = self.config.get('SERVER_IP')
-            playlist_name = self.config.get('PLAYLIST_NAME', 'Journey FM Recently Played')
-
-            if not plex_token or not server_ip:
-                QMessageBox.warning(self, "Configuration Error", "Plex token and server IP are required. Please check settings.")
-                return
-
-            from main import connect_to_plex_server
-            plex = connect_to_plex_server(plex_token, server_ip)
+        if self._export_in_flight:
+            return
 
-            # Get playlist
-            try:
-                playlist = plex.playlist(playlist_name)
-                tracks = playlist.items()
-            except Exception:
-                QMessageBox.warning(self, "Playlist Error", f"Playlist '{playlist_name}' not found.")
-                return
+        plex_token = self.config.get('PLEX_TOKEN')
+        server_ip = self.config.get('SERVER_IP')
+        playlist_name = self.config.get('PLAYLIST_NAME', 'Journey FM Recently Played')
 
-            # Export to CSV
-            import csv
-            with open('playlist_export.csv', 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow(['Title', 'Artist', 'Album'])
-                for track in tracks:
-                    writer.writerow([
-                        track.title,
-                        track.artist().title if track.artist() else '',
-                        track.album().title if track.album() else ''
-                    ])
+        if not plex_token or not server_ip:
+            QMessageBox.warning(self, "Configuration Error", "Plex token and server IP are required. Please check settings.")
+            return
 
-            QMessageBox.information(self, "Export Complete", f"Playlist exported to playlist_export.csv ({len(tracks)} songs)")
+        # Discovery and the per-track lookups are network-bound; keep them off the GUI thread
+        task = PlaylistExportTask(self._get_plex_server, plex_token, server_ip, playlist_name, 'playlist_export.csv')
+        task.signals.finished.connect(self.export_finished)
+        task.signals.playlistMissing.connect(self.export_playlist_missing)
+        task.signals.error.connect(self.export_failed)
+        self._export_task = task
+        self._export_in_flight = True
+        self.export_button.setEnabled(False)
+        self.status_label.setText("Exporting playlist...")
+        QThreadPool.globalInstance().start(task)
+
+    def _export_done(self):
+        self._export_in_flight = False
+        self._export_task = None
+        # Running updates and previews re-enable the controls themselves when they finish
+        self.set_action_controls_enabled(
+            self.connection_verified and not self._update_in_flight and not self._preview_in_flight
+        )
 
-        except Exception as e:
-            QMessageBox.critical(self, "Export Error", f"Failed to export playlist: {str(e)}")
+    def export_finished(self, track_count):
+        self._export_done()
+        self.status_label.setText("Playlist exported")
+        QMessageBox.information(self, "Export Complete", f"Playlist exported to playlist_export.csv ({track_count} songs)")
+
+    def export_playlist_missing(self, playlist_name):
+        self._export_done()
+        self.status_label.setText("Export failed")
+        QMessageBox.warning(self, "Playlist Error", f"Playlist '{playlist_name}' not found.")
+
+    def export_failed(self, message):
+        self._export_done()
+        self.status_label.setText("Export failed")
+        QMessageBox.critical(self, "Export Error", f"Failed to export playlist: {message}")
+
+    def showEvent(self, event):
+        """Bring the log viewer up to date with updates that ran while hidden"""
+        super().showEvent(event)
+        self.flush_log()
+        self.log_viewer.refresh_logs()
 
     def closeEvent(self, event):
         """Handle window close - minimize to tray instead of closing"""
@@ -1975,6 +2465,7 @@ class MainWindow(QMainWindow):
             )
             event.ignore()
         else:
+            self.close_history_db()
             event.accept()
 
 class SystemTrayApp:
@@ -1995,6 +2486,11 @@ class SystemTrayApp:
         # Set tray icon reference in main window
         self.main_window.set_tray_icon(self.tray_icon)
 
+        # Let pending config writes finish before the process exits
+        self.app.aboutToQuit.connect(self.main_window.config.wait_for_writes)
+        self.app.aboutToQuit.connect(self.main_window.close_history_db)
+        self.app.aboutToQuit.connect(self.main_window.close_log)
+
         # Show window initially
         self.main_window.show()
 
@@ -2006,7 +2502,7 @@ class SystemTrayApp:
             return
 
         self.tray_icon = QSystemTrayIcon(self.main_window)
-        self.tray_icon.setIcon(self.main_window.windowIcon())
+        self.tray_icon.setIcon(app_icon())
 
         # Create tray menu
         tray_menu = QMenu()
@@ -2050,18 +2546,14 @@ class SystemTrayApp:
 
 def main():
     """Main application entry point"""
-    with open('app_log.txt', 'a') as log:
-        log.write(f"{datetime.now()}: Starting Journey FM Playlist app...\n")
-    print("Starting Journey FM Playlist app...")
+    logger.info("Starting Journey FM Playlist app...")
     try:
         has_x11 = bool(os.environ.get('DISPLAY'))
         has_wayland = bool(os.environ.get('WAYLAND_DISPLAY'))
         if os.name != 'nt' and not (has_x11 or has_wayland):
             raise Exception("No graphical display detected (DISPLAY/WAYLAND_DISPLAY not set)")
         
-        print("Initializing GUI...")
-        with open('app_log.txt', 'a') as log:
-            log.write(f"{datetime.now()}: DISPLAY set, initializing GUI\n")
+        logger.info("DISPLAY set, initializing GUI")
         # Set up high DPI scaling
         QApplication.setHighDpiScaleFactorRoundingPolicy(
             Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
@@ -2069,17 +2561,12 @@ def main():
 
         # Create and run application
         tray_app = SystemTrayApp()
-        print("App initialized, starting event loop...")
-        with open('app_log.txt', 'a') as log:
-            log.write(f"{datetime.now()}: App initialized, starting event loop\n")
+        logger.info("App initialized, starting event loop")
         sys.exit(tray_app.run())
     except Exception as e:
-        error_msg = f"Failed to start GUI application: {e}"
-        print(error_msg)
+        logger.error("Failed to start GUI application: %s", e)
         print("Make sure you have a graphical display available (X11/Wayland) and DISPLAY environment variable is set.")
         print("If running remotely, use X forwarding or a VNC session.")
-        with open('app_log.txt', 'a') as log:
-            log.write(f"{datetime.now()}: {error_msg}\n")
         sys.exit(1)
 
 if __name__ == "__main__":
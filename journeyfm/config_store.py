@@ -1,8 +1,8 @@
-import json
 import os
 from pathlib import Path
 
-from journeyfm.paths import data_path
+from journeyfm import json_codec
+from journeyfm.paths import data_path, write_text_atomic
 
 try:
     import keyring
@@ -46,15 +46,14 @@ def _read_config_file(config_path=CONFIG_PATH):
     if not Path(config_path).exists():
         return {}
     try:
-        with open(config_path, "r", encoding="utf-8") as file_handle:
-            return json.load(file_handle)
+        with open(config_path, "rb") as file_handle:
+            return json_codec.loads(file_handle.read())
     except Exception:
         return {}
 
 
 def _write_config_file(config, config_path=CONFIG_PATH):
-    with open(config_path, "w", encoding="utf-8") as file_handle:
-        json.dump(config, file_handle, indent=2)
+    write_text_atomic(config_path, json_codec.dumps_pretty(config))
 
 
 def get_secret(key):
@@ -113,11 +112,18 @@ def migrate_legacy_secrets(config_path=CONFIG_PATH):
 
 def load_runtime_config(config_path=CONFIG_PATH):
     migrate_legacy_secrets(config_path)
-    config = dict(DEFAULT_CONFIG)
     file_config = _read_config_file(config_path)
-    config.update({key: value for key, value in file_config.items() if key in NON_SECRET_KEYS})
+    config = {key: value for key, value in file_config.items() if key in NON_SECRET_KEYS}
     config["PLEX_TOKEN"] = get_secret("PLEX_TOKEN")
+    return resolve_runtime_config(config)
+
+
+def resolve_runtime_config(values):
+    """Apply defaults, environment overrides and normalization to in-memory config values."""
+    config = dict(DEFAULT_CONFIG)
+    config.update({key: value for key, value in values.items() if key in NON_SECRET_KEYS or key == "PLEX_TOKEN"})
 
+    env_token = os.getenv("PLEX_TOKEN", "").strip()
     env_server = os.getenv("SERVER_IP", "").strip()
     env_playlist = os.getenv("PLAYLIST_NAME", "").strip()
     env_stations = os.getenv("SELECTED_STATIONS", "").strip()
@@ -125,6 +131,8 @@ def load_runtime_config(config_path=CONFIG_PATH):
     env_interval = os.getenv("UPDATE_INTERVAL", "").strip()
     env_unit = os.getenv("UPDATE_UNIT", "").strip()
 
+    if env_token:
+        config["PLEX_TOKEN"] = env_token
     if env_server:
         config["SERVER_IP"] = env_server
     if env_playlist:
@@ -149,7 +157,7 @@ def load_runtime_config(config_path=CONFIG_PATH):
 def save_runtime_config(config, config_path=CONFIG_PATH):
     config = dict(config)
     token = str(config.pop("PLEX_TOKEN", "")).strip()
-    if token:
+    if token and token != get_secret("PLEX_TOKEN"):
         set_secret("PLEX_TOKEN", token)
 
     persisted = {}
@@ -161,7 +169,8 @@ def save_runtime_config(config, config_path=CONFIG_PATH):
             persisted[key] = ",".join(value)
         else:
             persisted[key] = value
-    _write_config_file(persisted, config_path)
+    if persisted != _read_config_file(config_path):
+        _write_config_file(persisted, config_path)
 
 
 def get_display_config(config_path=CONFIG_PATH):
@@ -16,6 +16,84 @@ HISTORY_COLUMNS = {
     "error_message": "TEXT DEFAULT ''",
 }
 
+# One (date, type, artist, song, reason) row per history entry, expanded by SQLite's
+# JSON1 functions, for a page of runs (LIMIT ? OFFSET ?). Malformed JSON columns are
+# treated as empty lists.
+HISTORY_ENTRIES_SQL = """
+    WITH h AS (
+        -- Format each run's date once rather than once per expanded entry; SQLite
+        -- materializes a CTE used more than once, so no MATERIALIZED hint (3.35+) is needed
+        SELECT id, date, added_songs, missing_songs, skipped_songs, duplicate_count,
+               COALESCE(strftime('%Y-%m-%d %H:%M', date), date) AS date_str
+        FROM history
+        ORDER BY date DESC, id
+        LIMIT ? OFFSET ?
+    )
+    SELECT date_str, type, artist, song, reason FROM (
+        SELECT h.date, h.id, 0 AS kind, CAST(s.key AS INTEGER) AS pos,
+               h.date_str,
+               'Added' AS type,
+               CASE WHEN instr(s.value, ' by ') > 0
+                    THEN substr(s.value, instr(s.value, ' by ') + 4) ELSE 'Unknown' END AS artist,
+               CASE WHEN instr(s.value, ' by ') > 0
+                    THEN substr(s.value, 1, instr(s.value, ' by ') - 1) ELSE s.value END AS song,
+               '' AS reason
+        FROM h,
+             json_each(CASE WHEN json_valid(h.added_songs) THEN h.added_songs ELSE '[]' END) AS s
+        WHERE s.type = 'text'
+        UNION ALL
+        SELECT h.date, h.id, 1, CAST(s.key AS INTEGER),
+               h.date_str,
+               'Missing',
+               COALESCE(json_extract(s.value, '$.artist'), 'Unknown'),
+               COALESCE(json_extract(s.value, '$.title'), 'Unknown'),
+               COALESCE(json_extract(s.value, '$.reason'), 'not-found')
+        FROM h,
+             json_each(CASE WHEN json_valid(h.missing_songs) THEN h.missing_songs ELSE '[]' END) AS s
+        WHERE s.type = 'object'
+        UNION ALL
+        SELECT h.date, h.id, 2, CAST(s.key AS INTEGER),
+               h.date_str,
+               'Skipped',
+               COALESCE(json_extract(s.value, '$.artist'), 'Unknown'),
+               COALESCE(json_extract(s.value, '$.title'), 'Unknown'),
+               COALESCE(json_extract(s.value, '$.reason'), 'skipped')
+        FROM h,
+             json_each(CASE WHEN json_valid(h.skipped_songs) THEN h.skipped_songs ELSE '[]' END) AS s
+        WHERE s.type = 'object'
+        UNION ALL
+        SELECT h.date, h.id, 3, 0,
+               h.date_str,
+               'Info', '', 'Duplicate suppression', CAST(h.duplicate_count AS TEXT)
+        FROM h
+        WHERE h.duplicate_count
+    )
+    ORDER BY date DESC, id, kind, pos
+"""
+
+
+# One (day, added count, running added total, matched_count, duplicate_count,
+# station_breakdown) row per run, oldest first, for the analytics charts. NULL, empty
+# and malformed added_songs count as no songs.
+ANALYTICS_RUNS_SQL = """
+    SELECT COALESCE(strftime('%Y-%m-%d', date), date),
+           json_array_length(CASE WHEN json_valid(added_songs) THEN added_songs ELSE '[]' END),
+           SUM(json_array_length(CASE WHEN json_valid(added_songs) THEN added_songs ELSE '[]' END))
+               OVER (ORDER BY date, id ROWS UNBOUNDED PRECEDING),
+           matched_count, duplicate_count, station_breakdown
+    FROM history
+    ORDER BY date, id
+"""
+
+# (artist, songs added) over every "Title by Artist" entry in added_songs
+ANALYTICS_ARTISTS_SQL = """
+    SELECT substr(song.value, instr(song.value, ' by ') + 4) AS artist, COUNT(*)
+    FROM history,
+         json_each(CASE WHEN json_valid(history.added_songs) THEN history.added_songs ELSE '[]' END) AS song
+    WHERE song.type = 'text' AND instr(song.value, ' by ') > 0
+    GROUP BY artist
+"""
+
 
 def init_history_db(db_path=None):
     db_path = db_path or data_path("playlist_history.db")
@@ -39,9 +117,8 @@ def init_history_db(db_path=None):
         if column_name not in existing_columns:
             cursor.execute(f"ALTER TABLE history ADD COLUMN {column_name} {definition}")
 
-    # store scraped song detail for per-song/per-station analysis
-    if 'scraped_songs' not in existing_columns:
-        cursor.execute("ALTER TABLE history ADD COLUMN scraped_songs TEXT DEFAULT '[]'")
+    # newest-first paging in the history viewer walks this index instead of sorting the table
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_history_date ON history(date DESC, id)")
     conn.commit()
     conn.close()
 
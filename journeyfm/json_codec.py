@@ -0,0 +1,20 @@
+import json
+
+try:
+    import orjson
+except Exception:
+    orjson = None
+
+
+def loads(data):
+    """Decode JSON from ``str`` or ``bytes``, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_pretty(value):
+    """Encode ``value`` as two-space indented JSON text."""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(value, indent=2)
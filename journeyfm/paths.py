@@ -1,4 +1,6 @@
 import os
+import stat
+import tempfile
 from pathlib import Path
 
 
@@ -13,4 +15,24 @@ def get_data_dir() -> Path:
 
 
 def data_path(*parts: str) -> Path:
-    return get_data_dir().joinpath(*parts)
\ No newline at end of file
+    return get_data_dir().joinpath(*parts)
+
+
+def write_text_atomic(path, text, encoding="utf-8"):
+    """Replace ``path`` with ``text`` via a synced temp file so readers never see a partial write."""
+    path = Path(path)
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "w", encoding=encoding) as file_handle:
+            file_handle.write(text)
+            file_handle.flush()
+            os.fsync(file_handle.fileno())
+        if path.exists():
+            os.chmod(tmp_path, stat.S_IMODE(path.stat().st_mode))
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
@@ -1,8 +1,5 @@
 import urllib.parse
 
-from plexapi.myplex import MyPlexAccount
-from plexapi.server import PlexServer
-
 
 class PlexConnectionError(RuntimeError):
     pass
@@ -25,6 +22,9 @@ def resolve_plex_server_url(token, server_ip):
     if not target_host:
         raise PlexConnectionError("Missing Plex server address")
 
+    # plexapi is imported on first use to keep it off the GUI startup path
+    from plexapi.myplex import MyPlexAccount
+
     try:
         account = MyPlexAccount(token=token)
     except Exception as exc:
@@ -43,6 +43,8 @@ def resolve_plex_server_url(token, server_ip):
 
 
 def connect_to_plex_server(token, server_ip):
+    from plexapi.server import PlexServer
+
     server_url = resolve_plex_server_url(token, server_ip)
     try:
         return PlexServer(server_url, token)
@@ -0,0 +1,96 @@
+import os
+import stat
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from journeyfm import config_store
+from journeyfm.paths import write_text_atomic
+
+
+class ConfigStoreTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.config_path = Path(self.temp_dir.name) / "config.json"
+        # Keep the real keyring, environment and config.json out of the tests
+        patchers = (
+            mock.patch.object(config_store, "get_secret", return_value="stored-token"),
+            mock.patch.object(config_store, "set_secret"),
+            mock.patch.dict(os.environ, {}, clear=True),
+        )
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.set_secret = config_store.set_secret
+
+    def sample_config(self, **overrides):
+        config = {
+            "PLEX_TOKEN": "stored-token",
+            "SERVER_IP": "192.168.1.10",
+            "PLAYLIST_NAME": "Journey FM Recently Played",
+            "AUTO_UPDATE": True,
+            "UPDATE_INTERVAL": 15,
+            "UPDATE_UNIT": "Minutes",
+            "SELECTED_STATIONS": ["journey_fm", "spirit_fm"],
+        }
+        config.update(overrides)
+        return config
+
+    def test_unchanged_config_is_not_rewritten(self):
+        config_store.save_runtime_config(self.sample_config(), self.config_path)
+        with mock.patch.object(config_store, "_write_config_file") as write_config:
+            config_store.save_runtime_config(self.sample_config(), self.config_path)
+        write_config.assert_not_called()
+
+    def test_changed_config_is_rewritten(self):
+        config_store.save_runtime_config(self.sample_config(), self.config_path)
+        config_store.save_runtime_config(self.sample_config(UPDATE_INTERVAL=30), self.config_path)
+        saved = config_store._read_config_file(self.config_path)
+        self.assertEqual(30, saved["UPDATE_INTERVAL"])
+        self.assertEqual("journey_fm,spirit_fm", saved["SELECTED_STATIONS"])
+        self.assertNotIn("PLEX_TOKEN", saved)
+
+    def test_unchanged_token_is_not_stored_again(self):
+        config_store.save_runtime_config(self.sample_config(), self.config_path)
+        self.set_secret.assert_not_called()
+
+    def test_changed_token_is_stored(self):
+        config_store.save_runtime_config(self.sample_config(PLEX_TOKEN="new-token"), self.config_path)
+        self.set_secret.assert_called_once_with("PLEX_TOKEN", "new-token")
+
+    def test_environment_token_overrides_resolved_config(self):
+        os.environ["PLEX_TOKEN"] = "env-token"
+        config = config_store.resolve_runtime_config({"PLEX_TOKEN": "saved-token"})
+        self.assertEqual("env-token", config["PLEX_TOKEN"])
+
+
+class WriteTextAtomicTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.path = Path(self.temp_dir.name) / "config.json"
+
+    def leftover_temp_files(self):
+        return [name for name in os.listdir(self.temp_dir.name) if name.endswith(".tmp")]
+
+    def test_replace_keeps_permissions(self):
+        self.path.write_text("old", encoding="utf-8")
+        os.chmod(self.path, 0o600)
+        write_text_atomic(self.path, "new")
+        self.assertEqual("new", self.path.read_text(encoding="utf-8"))
+        self.assertEqual(0o600, stat.S_IMODE(self.path.stat().st_mode))
+        self.assertEqual([], self.leftover_temp_files())
+
+    def test_failed_write_leaves_target_and_no_temp_file(self):
+        self.path.write_text("old", encoding="utf-8")
+        # A lone surrogate cannot be encoded, so the write fails part-way through
+        with self.assertRaises(UnicodeEncodeError):
+            write_text_atomic(self.path, "new \udc80")
+        self.assertEqual("old", self.path.read_text(encoding="utf-8"))
+        self.assertEqual([], self.leftover_temp_files())
+
+
+if __name__ == '__main__':
+    unittest.main()
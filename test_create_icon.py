@@ -0,0 +1,31 @@
+import struct
+import unittest
+
+from create_icon import _png_to_ico
+
+
+class PngToIcoTests(unittest.TestCase):
+    def test_packs_directory_and_payloads(self):
+        small = b"\x89PNG small"
+        large = b"\x89PNG large payload"
+        ico = _png_to_ico({256: large, 16: small})
+
+        reserved, image_type, count = struct.unpack_from("<HHH", ico, 0)
+        self.assertEqual((0, 1, 2), (reserved, image_type, count))
+
+        entries = [struct.unpack_from("<BBBBHHII", ico, 6 + 16 * index) for index in range(count)]
+        data_start = 6 + 16 * 2
+        # Frames are stored smallest first; 256 px is written as 0
+        self.assertEqual([
+            (16, 16, 0, 0, 1, 32, len(small), data_start),
+            (0, 0, 0, 0, 1, 32, len(large), data_start + len(small)),
+        ], entries)
+
+        for payload, entry in zip((small, large), entries):
+            size, offset = entry[6], entry[7]
+            self.assertEqual(payload, ico[offset:offset + size])
+        self.assertEqual(data_start + len(small) + len(large), len(ico))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+
+from journeyfm.history_service import ANALYTICS_ARTISTS_SQL, ANALYTICS_RUNS_SQL, HISTORY_ENTRIES_SQL, init_history_db
+
+
+class HistoryDbTestCase(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        db_path = Path(self.temp_dir.name) / "playlist_history.db"
+        init_history_db(db_path)
+        self.conn = sqlite3.connect(db_path)
+        self.addCleanup(self.conn.close)
+
+    def add_run(self, date, added_songs='[]', missing_songs='[]', skipped_songs='[]', duplicate_count=0, **columns):
+        columns.update(
+            date=date,
+            added_songs=added_songs,
+            missing_songs=missing_songs,
+            skipped_songs=skipped_songs,
+            duplicate_count=duplicate_count,
+        )
+        names = ", ".join(columns)
+        placeholders = ", ".join("?" for _ in columns)
+        self.conn.execute(f"INSERT INTO history ({names}) VALUES ({placeholders})", list(columns.values()))
+        self.conn.commit()
+
+
+class HistoryEntriesSqlTests(HistoryDbTestCase):
+    def setUp(self):
+        super().setUp()
+        self.add_run(
+            "2024-01-01T10:00:00",
+            added_songs='["Song A by Artist A", "No Separator", 7]',
+            missing_songs='[{"title": "M1", "artist": "MA", "reason": "artist-mismatch"}, {"title": "M2"}]',
+            skipped_songs='[{"title": "S1", "artist": "SA"}]',
+            duplicate_count=2,
+        )
+        self.add_run(
+            "2024-01-02T09:30:00.123456",
+            added_songs=None,
+            missing_songs='',
+            skipped_songs='not json',
+        )
+        self.add_run(
+            "2024-01-03T08:00:00",
+            added_songs='["Title by Band by Other"]',
+            missing_songs='[42, {"title": "M3", "artist": "MA3"}]',
+            skipped_songs=None,
+            duplicate_count=None,
+        )
+
+    def entries(self, limit=-1, offset=0):
+        return self.conn.execute(HISTORY_ENTRIES_SQL, (limit, offset)).fetchall()
+
+    def test_expands_every_entry_kind_newest_run_first(self):
+        self.assertEqual([
+            ("2024-01-03 08:00", "Added", "Band by Other", "Title", ""),
+            ("2024-01-03 08:00", "Missing", "MA3", "M3", "not-found"),
+            ("2024-01-01 10:00", "Added", "Artist A", "Song A", ""),
+            ("2024-01-01 10:00", "Added", "Unknown", "No Separator", ""),
+            ("2024-01-01 10:00", "Missing", "MA", "M1", "artist-mismatch"),
+            ("2024-01-01 10:00", "Missing", "Unknown", "M2", "not-found"),
+            ("2024-01-01 10:00", "Skipped", "SA", "S1", "skipped"),
+            ("2024-01-01 10:00", "Info", "", "Duplicate suppression", "2"),
+        ], self.entries())
+
+    def test_malformed_null_and_empty_columns_yield_no_rows(self):
+        self.assertEqual([], self.entries(limit=1, offset=1))
+
+    def test_unparseable_date_is_shown_as_stored(self):
+        self.add_run("yesterday", added_songs='["X by Y"]')
+        self.assertEqual([("yesterday", "Added", "Y", "X", "")], self.entries(limit=1))
+
+    def test_pages_split_on_run_boundaries(self):
+        pages = [self.entries(limit=1, offset=offset) for offset in range(3)]
+        self.assertEqual([2, 0, 6], [len(page) for page in pages])
+        self.assertEqual(self.entries(), [row for page in pages for row in page])
+        self.assertEqual(self.entries()[:2], self.entries(limit=2, offset=0))
+        self.assertEqual(self.entries()[2:], self.entries(limit=2, offset=2))
+
+
+class AnalyticsSqlTests(HistoryDbTestCase):
+    def setUp(self):
+        super().setUp()
+        self.add_run("2024-01-01T10:00:00", added_songs='["A by X", "B by Y"]', matched_count=3, duplicate_count=1)
+        self.add_run("2024-01-02T10:00:00", added_songs=None)
+        self.add_run("2024-01-02T12:00:00", added_songs='')
+        self.add_run("2024-01-03T10:00:00", added_songs='["C by X", "Untitled"]', matched_count=None)
+        self.add_run("2024-01-04T10:00:00", added_songs='oops')
+
+    def test_per_run_and_running_added_counts(self):
+        rows = [row[:5] for row in self.conn.execute(ANALYTICS_RUNS_SQL)]
+        self.assertEqual([
+            ("2024-01-01", 2, 2, 3, 1),
+            ("2024-01-02", 0, 2, 0, 0),
+            ("2024-01-02", 0, 2, 0, 0),
+            ("2024-01-03", 2, 4, None, 0),
+            ("2024-01-04", 0, 4, 0, 0),
+        ], rows)
+
+    def test_artist_counts(self):
+        self.assertEqual({"X": 2, "Y": 1}, dict(self.conn.execute(ANALYTICS_ARTISTS_SQL)))
+
+
+if __name__ == '__main__':
+    unittest.main()